@@ -1,36 +1,71 @@
 import sys
 import os
 import re
-import io
 import csv
 import json
-from functools import partial
+import math
+import threading
+from collections import OrderedDict
+from functools import lru_cache, partial
 from pathlib import Path
 from datetime import datetime
-import fitz  # PyMuPDF
 from PyQt6 import QtWidgets, QtGui, QtCore
 from storage import (
     ensure_master,
     read_master,
     add_feature,
     update_feature,
+    upsert_features,
+    batch_update_features,
     delete_feature,
+    delete_features,
     read_wo,
     read_wo_notes,
-    write_master,
     parse_tolerance_expression,
     normalize_str,
     MASTER_HEADER,
     list_workorders,
     current_username,
-    upsert_result_entry,
+    batch_upsert_results,
+    db_mtime,
 )
-import spc
+
+
+class _DeferredModule:
+    """Module stand-in that runs its import on first attribute access, then replaces itself in this module.
+
+    The loaders keep plain import statements so PyInstaller still finds the modules.
+    """
+
+    def __init__(self, name: str, loader):
+        self._name = name
+        self._loader = loader
+
+    def __getattr__(self, attr):
+        module = self._loader()
+        globals()[self._name] = module
+        return getattr(module, attr)
+
+
+def _import_fitz():
+    import fitz  # PyMuPDF
+    return fitz
+
+
+def _import_spc():
+    import spc
+    return spc
+
+
+# PyMuPDF and the SPC module are only needed once a PDF is opened or the dashboard is shown,
+# so importing them is kept off the startup path
+fitz = _DeferredModule('fitz', _import_fitz)
+spc = _DeferredModule('spc', _import_spc)
 
 try:
-    from PIL import Image  # type: ignore
-except ImportError:  # Pillow is optional until OCR runs
-    Image = None
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # PyQt6 builds without the OpenGL widgets module
+    QOpenGLWidget = None
 
 
 BALLOON_RADIUS = 14
@@ -39,9 +74,53 @@ RECENT_FILE_LIMIT = 10
 RECENT_STORE_PATH = Path.home() / '.axis_recent.json'
 LAYOUT_HORIZONTAL = 'horizontal'
 LAYOUT_VERTICAL = 'vertical'
+PAGE_CACHE_LIMIT = 20
+# high zoom buckets produce very large rasters, so the page cache is also capped by size
+PAGE_CACHE_BYTES = 384 * 1024 * 1024
+# view-scale buckets for the current page; the one above the shown bucket is rasterized in the background for the next zoom-in
+PREFETCH_ZOOM_BUCKETS = (1.0, 2.0, 3.0)
+# view scales above this reuse the MAX_RENDER_FACTOR raster instead of rendering larger
+MAX_RENDER_FACTOR = 3.0
+# pixel budget for one page raster (about 160 MB as RGB32); large-format sheets at high zoom buckets are
+# rendered at the largest scale that fits and the view transform stretches the rest
+PAGE_RENDER_MAX_PIXELS = 40_000_000
+# fallbacks for geometry columns missing from a master row; 'br' is filled from the current balloon size
+ROW_DEFAULTS = {'page': '1', 'x': '0', 'y': '0', 'w': '0', 'h': '0', 'bx': '0', 'by': '0', 'zoom': '1.0'}
+# exported PDFs: drop unused objects and merge duplicates (garbage=3) but skip garbage=4's pairwise stream
+# comparison, and only deflate new content streams; the drawing's images and fonts are already compressed
+EXPORT_SAVE_OPTIONS = {'garbage': 3, 'deflate': True, 'deflate_images': False, 'deflate_fonts': False}
+# zoom re-render debounce, and the longest a continuous gesture may postpone it
+ZOOM_RERENDER_DELAY_MS = 100
+ZOOM_RERENDER_MAX_WAIT_MS = 300
+# pixel budget for the OCR capture of a page (about 40 MP, e.g. an E-size sheet at ~170 dpi)
+OCR_MAX_PIXELS = 40_000_000
+# share of MuPDF's resource store (decoded fonts/images) released once a page change's prefetch has drained
+FITZ_STORE_SHRINK_PERCENT = 80
+# GPU-backed PDF view; opt-in with --opengl because some drivers render QOpenGLWidget poorly
+USE_OPENGL_VIEWPORT = False
+
+# PyMuPDF shares one MuPDF context across threads and is not safe for concurrent use, so every fitz call
+# (open, load_page, page geometry, rendering, drawing, save, close, store maintenance) runs under this lock.
+# Reentrant so helpers like render_page_pixmap can be called from code that already holds it.
+# Hold it only around the fitz calls themselves; the UI thread takes page geometry from the rects read at open.
+_FITZ_LOCK = threading.RLock()
+_ID_NUM_RE = re.compile(r'(\d+)$')
+_PLAIN_NUMBER_RE = re.compile(r'^[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$')
+# a tolerance marker: '±', '+/-' or '+-' anywhere, a '+' past the first character, or two minus signs after it
+_TOLERANCE_MARKER_RE = re.compile(r'±|\+/?-|.\+|.-.*-', re.DOTALL)
 
 
 def format_number(value: float, decimals: int = 6) -> str:
+    # ints are accepted too; normalizing first also keeps 1 and 1.0 from sharing a cache entry by accident
+    return _format_float(float(value), decimals)
+
+
+@lru_cache(maxsize=4096)
+def _format_float(value: float, decimals: int) -> str:
+    if value == 0:
+        return '0'
+    if value.is_integer():
+        return str(int(value))
     text = f"{value:.{decimals}f}"
     if '.' in text:
         text = text.rstrip('0').rstrip('.')
@@ -50,6 +129,266 @@ def format_number(value: float, decimals: int = 6) -> str:
     return text
 
 
+@lru_cache(maxsize=4096)
+def string_has_tolerance(text: str) -> bool:
+    """True when text looks like a nominal with a tolerance (e.g. '1.25 +/-.005') rather than a plain value."""
+    if not text:
+        return False
+    normalized = normalize_str(text)
+    if not normalized:
+        return False
+    return _TOLERANCE_MARKER_RE.search(normalized) is not None
+
+
+@lru_cache(maxsize=4096)
+def parse_tolerance(text: str) -> tuple[float, float, float]:
+    """parse_tolerance_expression with repeat entries (pasted or re-typed specs) served from a cache."""
+    return parse_tolerance_expression(text)
+
+
+def feature_rect(feature: dict) -> tuple[float, float, float, float] | None:
+    """Picked rectangle (x, y, w, h) of a feature, parsed once and kept on the dict (it never moves)."""
+    rect = feature.get('_rect')
+    if rect is None:
+        try:
+            rect = (
+                float(feature.get('x', 0)),
+                float(feature.get('y', 0)),
+                float(feature.get('w', 0)),
+                float(feature.get('h', 0)),
+            )
+        except (TypeError, ValueError):
+            return None
+        feature['_rect'] = rect
+    return rect
+
+
+def feature_page_index(feature: dict) -> int:
+    """Zero-based page of a feature, parsed once and kept on the dict (a feature never changes page)."""
+    page_idx = feature.get('_page')
+    if page_idx is None:
+        try:
+            page_idx = int(feature.get('page', '1')) - 1
+        except (TypeError, ValueError):
+            page_idx = 0
+        feature['_page'] = page_idx
+    return page_idx
+
+
+def feature_zoom(feature: dict) -> float:
+    """View zoom stored when the feature was picked, parsed once and kept on the dict (it is never edited)."""
+    zoom = feature.get('_zoom')
+    if zoom is None:
+        try:
+            zoom = float(feature.get('zoom') or 1.0)
+        except (TypeError, ValueError):
+            zoom = 1.0
+        feature['_zoom'] = zoom
+    return zoom
+
+
+def balloon_label(fid: str) -> str:
+    """Trailing number of a feature id (what the balloon shows), or the id itself."""
+    m = _ID_NUM_RE.search(fid)
+    return m.group(1) if m else fid
+
+
+def parse_plain_number(text: str):
+    """Return float(text) for plain decimal strings, None otherwise (no exception on bad input)."""
+    if not text or not _PLAIN_NUMBER_RE.match(text):
+        return None
+    return float(text)
+
+
+@lru_cache(maxsize=8192)
+def compute_status(result_text: str, lsl_text: str, usl_text: str) -> str:
+    """PASS/FAIL/— for a stripped result against stripped LSL/USL strings (memoized; it is a pure function)."""
+    if not result_text:
+        return '—'
+    upper = result_text.upper()
+    if upper in ('PASS', 'FAIL'):
+        return upper
+    value = parse_plain_number(result_text)
+    if value is None:
+        return '—'
+    lsl_val = parse_plain_number(lsl_text)
+    usl_val = parse_plain_number(usl_text)
+    if lsl_val is None or usl_val is None:
+        return '—'
+    return 'PASS' if lsl_val <= value <= usl_val else 'FAIL'
+
+
+def zoom_bucket(scale: float) -> float:
+    """Round a view scale up to the next power of two so nearby zoom levels share one raster."""
+    if scale <= 0:
+        return 1.0
+    return float(2 ** math.ceil(math.log2(scale) - 1e-9))
+
+
+def render_bucket(scale: float) -> float:
+    """Zoom bucket actually rasterized for a view scale, capped at MAX_RENDER_FACTOR."""
+    return min(zoom_bucket(scale), MAX_RENDER_FACTOR)
+
+
+def limit_render_scale(page_rect, matrix_scale: float) -> float:
+    """Largest matrix scale up to matrix_scale whose raster of page_rect stays within PAGE_RENDER_MAX_PIXELS."""
+    area = float(page_rect.width) * float(page_rect.height)
+    if area <= 0 or area * matrix_scale * matrix_scale <= PAGE_RENDER_MAX_PIXELS:
+        return matrix_scale
+    return math.sqrt(PAGE_RENDER_MAX_PIXELS / area)
+
+
+def shrink_fitz_store(percent: int):
+    """Release part of MuPDF's global resource store so image-heavy drawings don't pile up across pages."""
+    try:
+        with _FITZ_LOCK:
+            fitz.TOOLS.store_shrink(percent)
+    except Exception:
+        pass
+
+
+def render_page_pixmap(page, zoom: float) -> "fitz.Pixmap":
+    """Rasterize a fitz page to an RGB fitz.Pixmap (no alpha)."""
+    with _FITZ_LOCK:
+        return page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+
+
+def render_page_image(page, zoom: float) -> QtGui.QImage:
+    """Rasterize a fitz page to a QImage that owns its pixels, for building pixmaps on the UI thread."""
+    with _FITZ_LOCK:
+        pix = render_page_pixmap(page, zoom)
+        samples = pix.samples_mv
+        width, height, stride = pix.width, pix.height, pix.stride
+    # the conversion only reads pix's buffer, so other threads can use MuPDF meanwhile
+    image = QtGui.QImage(samples, width, height, stride, QtGui.QImage.Format.Format_RGB888)
+    # converting here (while pix is alive) leaves QPixmap.fromImage nothing to convert on the UI thread
+    image = image.convertToFormat(QtGui.QImage.Format.Format_RGB32)
+    del samples
+    with _FITZ_LOCK:
+        del pix
+    return image
+
+
+def read_page_rects(doc) -> list:
+    """Rect of every page of doc, read once so page geometry lookups never wait on MuPDF."""
+    with _FITZ_LOCK:
+        return [page.rect for page in doc]
+
+
+def pixmap_from_image(image: QtGui.QImage, dpr: float = 1.0) -> QtGui.QPixmap:
+    # render_page_image already hands over RGB32, so skip Qt's format/dither pass and just copy
+    pixmap = QtGui.QPixmap.fromImage(image, QtCore.Qt.ImageConversionFlag.NoFormatConversion)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+class PageRenderSignals(QtCore.QObject):
+    rendered = QtCore.pyqtSignal(str, int, int, float, QtGui.QImage)
+
+
+class PageRenderTask(QtCore.QRunnable):
+    """Render one PDF page off the UI thread and post the raw samples back via signals."""
+    _local = threading.local()
+
+    def __init__(self, signals: PageRenderSignals, doc_path: str, generation: int, page_idx: int, zoom: float):
+        super().__init__()
+        self.signals = signals
+        self.doc_path = doc_path
+        # load generation of the window's document; a file replaced on disk keeps its path but not its generation
+        self.generation = generation
+        self.page_idx = page_idx
+        self.zoom = zoom
+
+    @classmethod
+    def _thread_document(cls, doc_path: str, generation: int):
+        # each worker thread keeps its own handle; fitz documents must not be shared across threads
+        doc = getattr(cls._local, 'doc', None)
+        if doc is not None and getattr(cls._local, 'key', None) == (doc_path, generation):
+            return doc
+        with _FITZ_LOCK:
+            if doc is not None:
+                try:
+                    doc.close()
+                except Exception:
+                    pass
+            doc = fitz.open(doc_path, filetype='pdf')
+        cls._local.doc = doc
+        cls._local.key = (doc_path, generation)
+        return doc
+
+    def run(self):
+        try:
+            with _FITZ_LOCK:
+                doc = self._thread_document(self.doc_path, self.generation)
+                page = doc.load_page(self.page_idx)
+            try:
+                image = render_page_image(page, self.zoom)
+            finally:
+                with _FITZ_LOCK:
+                    del page
+        except Exception:
+            return
+        try:
+            self.signals.rendered.emit(self.doc_path, self.generation, self.page_idx, self.zoom, image)
+        except RuntimeError:
+            # receiver went away while rendering
+            pass
+
+
+class PdfOpenSignals(QtCore.QObject):
+    opened = QtCore.pyqtSignal(str, object)
+
+
+class PdfOpenTask(QtCore.QRunnable):
+    """Open a PDF, prepare its master data and render the first page off the UI thread."""
+
+    def __init__(self, signals: PdfOpenSignals, path: str, matrix_scale: float):
+        super().__init__()
+        self.signals = signals
+        self.path = path
+        self.matrix_scale = matrix_scale
+
+    def run(self):
+        result = {'doc': None, 'error': None, 'rows': None, 'master_error': None,
+                  'image': None, 'matrix_scale': self.matrix_scale,
+                  'mtime': None, 'page_rects': None}
+        try:
+            result['mtime'] = os.path.getmtime(self.path)
+        except OSError:
+            pass
+        try:
+            with _FITZ_LOCK:
+                result['doc'] = fitz.open(self.path, filetype='pdf')
+        except Exception as exc:
+            result['error'] = exc
+        if result['doc'] is not None:
+            try:
+                ensure_master(self.path)
+                result['rows'] = read_master(self.path)
+            except Exception as exc:
+                result['master_error'] = exc
+            try:
+                result['page_rects'] = read_page_rects(result['doc'])
+                if result['page_rects']:
+                    result['matrix_scale'] = limit_render_scale(result['page_rects'][0], self.matrix_scale)
+                    with _FITZ_LOCK:
+                        first_page = result['doc'].load_page(0)
+                    try:
+                        result['image'] = render_page_image(first_page, result['matrix_scale'])
+                    finally:
+                        with _FITZ_LOCK:
+                            del first_page
+            except Exception:
+                # the UI thread renders (and reports) the page itself
+                pass
+        try:
+            self.signals.opened.emit(self.path, result)
+        except RuntimeError:
+            if result['doc'] is not None:
+                with _FITZ_LOCK:
+                    result['doc'].close()
+
+
 class StartSessionDialog(QtWidgets.QDialog):
     """Prompt for Serial Number (Inspection) or start Ballooning mode."""
     def __init__(self, parent=None, previous_orders=None, allow_ballooning=True):
@@ -188,106 +527,512 @@ class MethodListDialog(QtWidgets.QDialog):
         return values
 
 
-class BalloonItem(QtWidgets.QGraphicsEllipseItem):
+class BalloonItem(QtWidgets.QGraphicsItem):
+    """Movable balloon that paints its circle and number in a single paint() call."""
+
+    # render balloons with a red theme while keeping legibility against the page
+    OUTLINE_COLOR = QtGui.QColor(220, 40, 40)
+    PEN = QtGui.QPen(OUTLINE_COLOR, 2)
+    BRUSH = QtGui.QBrush(QtGui.QColor(255, 230, 230))
+    # bold label fonts shared by every balloon of the same point size (built lazily, QFont needs the app)
+    _fonts_by_size: dict[int, QtGui.QFont] = {}
+    # laid-out labels keyed by (text, point size); drawStaticText skips the per-paint text layout drawText does
+    _label_texts: dict[tuple[str, int], QtGui.QStaticText] = {}
+
     def __init__(self, feature: dict, image_item: QtWidgets.QGraphicsPixmapItem, parent=None):
-        x = float(feature.get('x', 0))
-        y = float(feature.get('y', 0))
-        w = float(feature.get('w', 10))
-        h = float(feature.get('h', 10))
+        super().__init__(parent)
+        # no valid radius yet, so the first rebind always sizes the item and picks its font
+        self.radius = -1.0
+        self._point_size = -1
+        self.label = None
+        self._rect = QtCore.QRectF()
+        self._shape = QtGui.QPainterPath()
+        self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
+        # rasterize once per zoom level so panning blits instead of repainting circle and text
+        self.setCacheMode(QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        # position changes are only reported while the user drags (see mousePressEvent)
+        self.rebind(feature)
+
+    def rebind(self, feature: dict):
+        """Point this item at another feature so page changes can reuse items instead of rebuilding them."""
+        x, y, w, h = feature_rect(feature) or (0.0, 0.0, 10.0, 10.0)
         bx = float(feature.get('bx', 0))
         by = float(feature.get('by', 0))
         radius = float(feature.get('br', BALLOON_RADIUS))
         # base center of the picked rectangle
         cx = x + w / 2.0
         cy = y + h / 2.0
-        # ellipse rect centered at (0,0), then position item at center+offsets
-        super().__init__(-radius, -radius, radius * 2.0, radius * 2.0)
+        self._anchor = (cx, cy)
+        self._last_offset = (bx, by)
+        # circle centered at (0,0), then position item at center+offsets
+        if radius != self.radius:
+            self._set_geometry(radius)
         self.setPos(cx + bx, cy + by)
-        # render balloons with a red theme while keeping legibility against the page
-        circle_color = QtGui.QColor(220, 40, 40)
-        outline = QtGui.QPen(circle_color, 2)
-        self.setBrush(QtGui.QBrush(QtGui.QColor(255, 230, 230)))
-        self.setPen(outline)
         self.setZValue(10)
-        self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
-        self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
+        self.setOpacity(1.0)
+        self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIgnoresParentOpacity, False)
         self.feature = feature
-        self._save_timer = QtCore.QTimer()
-        self._save_timer.setSingleShot(True)
-        self._save_timer.timeout.connect(self._persist_offset)
-        self.radius = radius
         # number text inside balloon
         full_id = feature.get('id', '')
-        num_only = full_id
-        m = QtCore.QRegularExpression(r"(\d+)$").match(full_id)
-        if m.hasMatch():
-            num_only = m.captured(1)
-        self.text_item = QtWidgets.QGraphicsSimpleTextItem(num_only, self)
-        font = QtGui.QFont()
-        font.setBold(True)
-        self.text_item.setFont(font)
-        self.text_item.setBrush(QtGui.QBrush(circle_color))
-        self._update_text_appearance()
+        self.label = balloon_label(full_id)
+        self._update_label_text()
+        self.setData(QtCore.Qt.ItemDataRole.UserRole, full_id or None)
         # tooltip with full id
         self.setToolTip(full_id)
+        self.update()
+
+    def release(self):
+        """Hide the item so the controller can pool it for reuse."""
+        self.setVisible(False)
+
+    def boundingRect(self) -> QtCore.QRectF:
+        half_pen = self.PEN.widthF() / 2.0
+        return self._rect.adjusted(-half_pen, -half_pen, half_pen, half_pen)
+
+    def shape(self) -> QtGui.QPainterPath:
+        # hit tests (clicks, rubber-band picks) call this per candidate item, so the path is built once per radius
+        return self._shape
+
+    def paint(self, painter: QtGui.QPainter, option, widget=None):
+        painter.setPen(self.PEN)
+        painter.setBrush(self.BRUSH)
+        painter.drawEllipse(self._rect)
+        # glyphs are filled with the pen color and ignore its width, so the outline pen draws the label as well
+        painter.setFont(self._font)
+        painter.drawStaticText(self._label_pos, self._label_text)
 
     def set_radius(self, radius: float):
-        self.radius = radius
-        self.prepareGeometryChange()
-        self.setRect(-radius, -radius, radius * 2.0, radius * 2.0)
-        self._update_text_appearance()
+        self._set_geometry(radius)
         self.feature['br'] = str(radius)
         self.update()
 
+    def _set_geometry(self, radius: float):
+        self.prepareGeometryChange()
+        self.radius = radius
+        self._rect = QtCore.QRectF(-radius, -radius, radius * 2.0, radius * 2.0)
+        path = QtGui.QPainterPath()
+        path.addEllipse(self._rect)
+        self._shape = path
+        self._update_text_appearance()
+
     def _update_text_appearance(self):
         # scale text proportionally so balloon numbers stay legible
         point_size = max(6, int(round(self.radius * 0.7)))
-        font = self.text_item.font()
-        font.setPointSize(point_size)
-        self.text_item.setFont(font)
-        br = self.text_item.boundingRect()
-        self.text_item.setPos(-br.width() / 2.0, -br.height() / 2.0)
+        if point_size == self._point_size:
+            # font and laid-out label are still valid; only the circle changed
+            return
+        font = self._fonts_by_size.get(point_size)
+        if font is None:
+            font = QtGui.QFont()
+            font.setBold(True)
+            font.setPointSize(point_size)
+            self._fonts_by_size[point_size] = font
+        self._font = font
+        self._point_size = point_size
+        if self.label is not None:
+            self._update_label_text()
+
+    def _update_label_text(self):
+        key = (self.label, self._point_size)
+        text = self._label_texts.get(key)
+        if text is None:
+            text = QtGui.QStaticText(self.label)
+            text.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+            text.prepare(QtGui.QTransform(), self._font)
+            self._label_texts[key] = text
+        size = text.size()
+        self._label_text = text
+        self._label_pos = QtCore.QPointF(-size.width() / 2.0, -size.height() / 2.0)
 
     def itemChange(self, change, value):
         if change == QtWidgets.QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
-            # compute new bx,by relative to rect center
-            try:
-                x = float(self.feature.get('x', 0))
-                y = float(self.feature.get('y', 0))
-                w = float(self.feature.get('w', 10))
-                h = float(self.feature.get('h', 10))
-                cx = x + w/2
-                cy = y + h/2
-                center = self.pos()
-                bx = center.x() - cx
-                by = center.y() - cy
-                self.feature['bx'] = str(bx)
-                self.feature['by'] = str(by)
-                if self._save_timer.isActive():
-                    self._save_timer.stop()
-                self._save_timer.start(150)
-            except Exception:
-                pass
+            # keep raw floats while dragging; _persist_offset formats them once
+            bx, by = self._offset_from_pos()
+            last_bx, last_by = self._last_offset
+            if abs(bx - last_bx) >= 0.25 or abs(by - last_by) >= 0.25:
+                self._last_offset = (bx, by)
+                self.feature['bx'] = bx
+                self.feature['by'] = by
+                controller = self._controller()
+                if controller is not None:
+                    controller._schedule_balloon_persist(self)
+                else:
+                    self._persist_offset()
         return super().itemChange(change, value)
 
+    def _offset_from_pos(self) -> tuple[float, float]:
+        # bx,by relative to the picked rect center
+        center = self.pos()
+        return center.x() - self._anchor[0], center.y() - self._anchor[1]
+
     def _persist_offset(self):
         try:
             pdf_path = self.feature.get('_pdf')
             fid = self.feature.get('id')
             if not pdf_path or not fid:
                 return
-            update_feature(pdf_path, fid, {
-                "bx": self.feature.get('bx', '0'),
-                "by": self.feature.get('by', '0'),
-            })
+            bx, by = self._offset_from_pos()
+            self._last_offset = (bx, by)
+            updates = {
+                "bx": format_number(bx),
+                "by": format_number(by),
+            }
+            self.feature.update(updates)
+            controller = self._controller()
+            if controller is not None and controller.pdf_path == pdf_path:
+                controller._queue_feature_update(fid, updates)
+            else:
+                update_feature(pdf_path, fid, updates)
         except Exception:
             pass
 
+    def _controller(self):
+        scene = self.scene()
+        if scene is None:
+            return None
+        for view in scene.views():
+            controller = getattr(view, 'controller', None)
+            if controller is not None and hasattr(controller, '_queue_feature_update'):
+                return controller
+        return None
+
+    def mousePressEvent(self, event):
+        controller = self._controller()
+        if controller is not None and controller.mode == 'Ballooning' and controller.pick_on_print:
+            # let pick-on-print rubber bands start on top of existing balloons
+            event.ignore()
+            return
+        self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
+        super().mousePressEvent(event)
+
     def mouseReleaseEvent(self, event):
-        if self._save_timer.isActive():
-            self._save_timer.stop()
+        controller = self._controller()
+        if controller is not None:
+            controller._dirty_balloons.discard(self)
         self._persist_offset()
         super().mouseReleaseEvent(event)
+        self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, False)
+
+
+class BalloonLayer(QtWidgets.QGraphicsItem):
+    """Content-less parent for the current page's balloons so they enter, leave and hide from the scene together."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemHasNoContents, True)
+        # above the highlight rect (z=18) so the selected balloon stays on top of it
+        self.setZValue(19)
+
+    def boundingRect(self) -> QtCore.QRectF:
+        return QtCore.QRectF()
+
+    def paint(self, painter, option, widget=None):
+        pass
+
+
+class FeatureTableModel(QtCore.QAbstractTableModel):
+    """Checklist rows backed by the feature dicts; the view pulls cell text on demand."""
+
+    HEADERS = ['ID', 'Page', 'Method', 'User', 'Result', 'Nominal', 'LSL', 'USL', 'Notes', 'Status']
+    COL_ID, COL_PAGE, COL_METHOD, COL_USERNAME, COL_RESULT, COL_NOMINAL, COL_LSL, COL_USL, COL_NOTES, COL_STATUS = range(10)
+    FEATURE_KEYS = {
+        COL_ID: 'id',
+        COL_PAGE: 'page',
+        COL_METHOD: 'method',
+        COL_NOMINAL: 'nominal',
+        COL_LSL: 'lsl',
+        COL_USL: 'usl',
+    }
+    # brushes rather than colors so the delegate paints them without a per-cell QColor->QBrush conversion
+    STATUS_BACKGROUNDS = {
+        'PASS': QtGui.QBrush(QtGui.QColor(200, 235, 200)),
+        'FAIL': QtGui.QBrush(QtGui.QColor(247, 205, 205)),
+        '—': QtGui.QBrush(QtGui.QColor(235, 235, 235)),
+    }
+    STATUS_FOREGROUNDS = {
+        'PASS': QtGui.QBrush(QtGui.QColor(10, 80, 10)),
+        'FAIL': QtGui.QBrush(QtGui.QColor(140, 20, 20)),
+        '—': QtGui.QBrush(QtGui.QColor(200, 200, 200)),
+    }
+    DEFAULT_STATUS_FOREGROUND = QtGui.QBrush(QtGui.QColor(220, 220, 220))
+
+    # emitted after a user edit has been stored, mirroring QTableWidget.cellChanged
+    cellEdited = QtCore.pyqtSignal(int, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._features: list[dict] = []
+        self._results: list[str] = []
+        self._notes: list[str] = []
+        self._statuses: list[str] = []
+        self._row_by_fid: dict[str, int] = {}
+        self._specs_editable = False
+        self._notes_editable = False
+        self._show_creator = False
+        self._bold_font = QtGui.QFont()
+        self._bold_font.setBold(True)
+
+    def set_rows(self, features, results, notes, statuses, *, specs_editable: bool, notes_editable: bool, show_creator: bool):
+        features = list(features)
+        same_rows = (
+            len(features) == len(self._features)
+            and (specs_editable, notes_editable, show_creator) == (self._specs_editable, self._notes_editable, self._show_creator)
+            and all(new is old for new, old in zip(features, self._features))
+        )
+        if same_rows:
+            # same features in the same order: refresh the cells in place and keep the view's rows, selection and scroll
+            self._results = list(results)
+            self._notes = list(notes)
+            self._statuses = list(statuses)
+            if features:
+                self.dataChanged.emit(self.index(0, 0), self.index(len(features) - 1, len(self.HEADERS) - 1))
+            return
+        self.beginResetModel()
+        self._features = features
+        self._results = list(results)
+        self._notes = list(notes)
+        self._statuses = list(statuses)
+        self._reindex()
+        self._specs_editable = specs_editable
+        self._notes_editable = notes_editable
+        self._show_creator = show_creator
+        self.endResetModel()
+
+    def clear(self):
+        self.set_rows([], [], [], [], specs_editable=False, notes_editable=False, show_creator=False)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._features)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Orientation.Horizontal:
+            return self.HEADERS[section] if 0 <= section < len(self.HEADERS) else None
+        return str(section + 1)
+
+    def feature_at(self, row: int):
+        if 0 <= row < len(self._features):
+            return self._features[row]
+        return None
+
+    def row_of(self, fid: str) -> int:
+        return self._row_by_fid.get(fid, -1)
+
+    def _reindex(self):
+        self._row_by_fid = {feature.get('id'): row for row, feature in enumerate(self._features)}
+
+    def cell_text(self, row: int, col: int) -> str:
+        if row < 0 or row >= len(self._features):
+            return ''
+        if col == self.COL_RESULT:
+            return self._results[row]
+        if col == self.COL_NOTES:
+            return self._notes[row]
+        if col == self.COL_STATUS:
+            return self._statuses[row]
+        feature = self._features[row]
+        if col == self.COL_USERNAME:
+            if self._show_creator or self._results[row].strip():
+                return feature.get('username', '')
+            return ''
+        key = self.FEATURE_KEYS.get(col)
+        if key is None:
+            return ''
+        value = feature.get(key, '')
+        return value if isinstance(value, str) else str(value)
+
+    def row_values(self) -> list[list[str]]:
+        """All rows as display strings in HEADERS order, read straight from the backing lists."""
+        show_creator = self._show_creator
+        values = []
+        for feature, result, note, status in zip(self._features, self._results, self._notes, self._statuses):
+            get = feature.get
+            values.append([
+                str(get('id', '')),
+                str(get('page', '')),
+                str(get('method', '')),
+                get('username', '') if show_creator or result.strip() else '',
+                result,
+                str(get('nominal', '')),
+                str(get('lsl', '')),
+                str(get('usl', '')),
+                note,
+                status,
+            ])
+        return values
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role in (QtCore.Qt.ItemDataRole.DisplayRole, QtCore.Qt.ItemDataRole.EditRole):
+            return self.cell_text(row, col)
+        if col not in (self.COL_RESULT, self.COL_STATUS):
+            return None
+        status = self._statuses[row]
+        if role == QtCore.Qt.ItemDataRole.BackgroundRole:
+            return self.STATUS_BACKGROUNDS.get(status)
+        if role == QtCore.Qt.ItemDataRole.ForegroundRole:
+            return self.STATUS_FOREGROUNDS.get(status, self.DEFAULT_STATUS_FOREGROUND)
+        if role == QtCore.Qt.ItemDataRole.FontRole and status in ('PASS', 'FAIL'):
+            return self._bold_font
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.ItemFlag.NoItemFlags
+        flags = QtCore.Qt.ItemFlag.ItemIsSelectable | QtCore.Qt.ItemFlag.ItemIsEnabled
+        col = index.column()
+        # Result editable in both modes (Ballooning: used for tol autofill; Inspection: writes to WO)
+        if (
+            col == self.COL_RESULT
+            or (col == self.COL_NOTES and self._notes_editable)
+            or (self._specs_editable and col in (self.COL_METHOD, self.COL_NOMINAL, self.COL_LSL, self.COL_USL))
+        ):
+            flags |= QtCore.Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=QtCore.Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.EditRole:
+            return False
+        # flags() is the single source of truth for what the current mode may edit
+        if not self.flags(index) & QtCore.Qt.ItemFlag.ItemIsEditable:
+            return False
+        row, col = index.row(), index.column()
+        text = '' if value is None else str(value)
+        if text == self.cell_text(row, col):
+            return True
+        if not self.set_cell(row, col, text):
+            return False
+        self.cellEdited.emit(row, col)
+        return True
+
+    def set_cell(self, row: int, col: int, text: str) -> bool:
+        """Store a cell value without reporting it as a user edit."""
+        if row < 0 or row >= len(self._features):
+            return False
+        if col == self.COL_RESULT:
+            self._results[row] = text
+        elif col == self.COL_NOTES:
+            self._notes[row] = text
+        elif col == self.COL_STATUS:
+            self._statuses[row] = text
+        elif col in self.FEATURE_KEYS and col not in (self.COL_ID, self.COL_PAGE):
+            self._features[row][self.FEATURE_KEYS[col]] = text
+        else:
+            return False
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def refresh_row(self, row: int):
+        """Repaint one row after its feature dict was changed in place."""
+        if 0 <= row < len(self._features):
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def insert_row(self, row: int, feature: dict, result: str = '', note: str = '', status: str = '—'):
+        row = max(0, min(row, len(self._features)))
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._features.insert(row, feature)
+        self._results.insert(row, result)
+        self._notes.insert(row, note)
+        self._statuses.insert(row, status)
+        if row == len(self._features) - 1:
+            self._row_by_fid[feature.get('id')] = row
+        else:
+            self._reindex()
+        self.endInsertRows()
+
+    def remove_row(self, row: int) -> bool:
+        if row < 0 or row >= len(self._features):
+            return False
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self._features[row]
+        del self._results[row]
+        del self._notes[row]
+        del self._statuses[row]
+        self._reindex()
+        self.endRemoveRows()
+        return True
+
+    def remove_rows(self, rows) -> int:
+        """Remove several rows with one beginRemoveRows/endRemoveRows pair per contiguous run."""
+        doomed = sorted({row for row in rows if 0 <= row < len(self._features)}, reverse=True)
+        # walk the runs bottom-up so the row numbers of runs still to come stay valid
+        index = 0
+        while index < len(doomed):
+            last = first = doomed[index]
+            index += 1
+            while index < len(doomed) and doomed[index] == first - 1:
+                first = doomed[index]
+                index += 1
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            del self._features[first:last + 1]
+            del self._results[first:last + 1]
+            del self._notes[first:last + 1]
+            del self._statuses[first:last + 1]
+            self.endRemoveRows()
+        if doomed:
+            self._reindex()
+        return len(doomed)
+
+    def set_status(self, row: int, status: str):
+        if row < 0 or row >= len(self._features):
+            return
+        if self._statuses[row] == status:
+            # tints are unchanged; only the user column, which follows the result, may need a repaint
+            user_index = self.index(row, self.COL_USERNAME)
+            self.dataChanged.emit(user_index, user_index)
+            return
+        self._statuses[row] = status
+        # the user column follows the result, and both result and status cells are tinted by status
+        self.dataChanged.emit(self.index(row, self.COL_USERNAME), self.index(row, self.COL_STATUS))
+
+
+class MethodDelegate(QtWidgets.QStyledItemDelegate):
+    """Combo box editor for the Method column, created only while a cell is being edited."""
+
+    def __init__(self, controller: "MainWindow", parent=None):
+        super().__init__(parent)
+        self.controller = controller
+
+    def createEditor(self, parent, option, index):
+        if not index.flags() & QtCore.Qt.ItemFlag.ItemIsEditable:
+            return None
+        combo = QtWidgets.QComboBox(parent)
+        combo.setEditable(False)
+        combo.setInsertPolicy(QtWidgets.QComboBox.InsertPolicy.NoInsert)
+        # all editors share the controller's list model, so nothing is copied per edit
+        combo.setModel(self.controller._method_model)
+        combo.activated.connect(self._editor_activated)
+        return combo
+
+    def setEditorData(self, editor, index):
+        value = index.data(QtCore.Qt.ItemDataRole.EditRole) or ''
+        if editor.findText(value, QtCore.Qt.MatchFlag.MatchExactly) < 0:
+            # give this editor its own copy rather than adding a stray value to the shared model
+            choices = editor.model().stringList() + [value]
+            editor.setModel(QtCore.QStringListModel(choices, editor))
+        editor.setCurrentText(value)
+
+    def setModelData(self, editor, model, index):
+        value = editor.currentText()
+        if value != (index.data(QtCore.Qt.ItemDataRole.EditRole) or ''):
+            model.setData(index, value, QtCore.Qt.ItemDataRole.EditRole)
+
+    def _editor_activated(self, _index: int):
+        # one bound slot for every editor; the combo that fired is the sender
+        editor = self.sender()
+        if isinstance(editor, QtWidgets.QComboBox):
+            self._commit_and_close(editor)
+
+    def _commit_and_close(self, editor, _index=None):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor, QtWidgets.QAbstractItemDelegate.EndEditHint.NoHint)
 
 
 class PDFView(QtWidgets.QGraphicsView):
@@ -297,10 +1042,12 @@ class PDFView(QtWidgets.QGraphicsView):
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self.controller = controller  # explicit reference to MainWindow
-        self.setScene(QtWidgets.QGraphicsScene(self))
+        scene = QtWidgets.QGraphicsScene(self)
+        # a page holds one pixmap plus a few dozen balloons; a linear scan beats maintaining a BSP tree
+        scene.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.setScene(scene)
         self._pixmap_item = None
-        self._rubber = QtWidgets.QRubberBand(QtWidgets.QRubberBand.Shape.Rectangle, self)
-        self._rubber_origin = None
+        self._picking = False
         self._current_scale = 1.0
         self._min_scale = 0.2
         self._max_scale = 40.0
@@ -310,6 +1057,8 @@ class PDFView(QtWidgets.QGraphicsView):
         self.setRenderHints(
             QtGui.QPainter.RenderHint.Antialiasing | QtGui.QPainter.RenderHint.SmoothPixmapTransform
         )
+        if USE_OPENGL_VIEWPORT and QOpenGLWidget is not None:
+            self.setViewport(QOpenGLWidget())
         self.setDragMode(QtWidgets.QGraphicsView.DragMode.ScrollHandDrag)
         self.setTransformationAnchor(QtWidgets.QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setResizeAnchor(QtWidgets.QGraphicsView.ViewportAnchor.AnchorUnderMouse)
@@ -317,7 +1066,7 @@ class PDFView(QtWidgets.QGraphicsView):
         self.setCacheMode(QtWidgets.QGraphicsView.CacheModeFlag.CacheBackground)  # [ZOOM-DEBOUNCE]
         self.setViewportUpdateMode(QtWidgets.QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)  # [ZOOM-DEBOUNCE]
 
-    def load_page(self, qimage: QtGui.QImage, scene_size: tuple[float, float] | None = None):
+    def load_page(self, pix: QtGui.QPixmap, scene_size: tuple[float, float] | None = None):
         scene = self.scene()
         if scene is None:
             return
@@ -329,7 +1078,6 @@ class PDFView(QtWidgets.QGraphicsView):
             except Exception:
                 pass
             self._pixmap_item = None
-        pix = QtGui.QPixmap.fromImage(qimage)
         self._pixmap_item = scene.addPixmap(pix)
         if scene_size is not None:
             width, height = scene_size
@@ -372,9 +1120,6 @@ class PDFView(QtWidgets.QGraphicsView):
         self._current_scale = self.transform().m11()
         event.accept()
         
-        # keep rubber band consistent
-        if self._rubber.isVisible():
-            self._rubber.hide()
         if hasattr(self.controller, '_schedule_rerender_for_zoom'):
             self.controller._schedule_rerender_for_zoom(self._current_scale)  # [ZOOM-DEBOUNCE]
 
@@ -396,12 +1141,19 @@ class PDFView(QtWidgets.QGraphicsView):
         if hasattr(self.controller, '_schedule_rerender_for_zoom'):
             self.controller._schedule_rerender_for_zoom(self._current_scale)  # [ZOOM-DEBOUNCE]
 
+    def set_pick_mode(self, active: bool):
+        # pick-on-print draws its selection with the view's own rubber band instead of a QRubberBand widget
+        mode = QtWidgets.QGraphicsView.DragMode.RubberBandDrag if active else QtWidgets.QGraphicsView.DragMode.ScrollHandDrag
+        if self.dragMode() != mode:
+            self.setDragMode(mode)
+        if not active:
+            self._picking = False
+
     def mousePressEvent(self, event):
         if self.controller.mode == 'Ballooning' and self.controller.pick_on_print:
             if event.button() == QtCore.Qt.MouseButton.LeftButton:
-                self._rubber_origin = event.pos()
-                self._rubber.setGeometry(QtCore.QRect(self._rubber_origin, QtCore.QSize()))
-                self._rubber.show()
+                self._picking = True
+                super().mousePressEvent(event)
                 return
             if event.button() in (QtCore.Qt.MouseButton.MiddleButton, QtCore.Qt.MouseButton.RightButton):
                 # allow panning with alternate buttons while pick mode is active
@@ -424,10 +1176,7 @@ class PDFView(QtWidgets.QGraphicsView):
                 vbar.setValue(vbar.value() - delta.y())
             event.accept()
             return
-        if self._rubber.isVisible():
-            self._rubber.setGeometry(QtCore.QRect(self._rubber_origin, event.pos()).normalized())
-        else:
-            super().mouseMoveEvent(event)
+        super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):
         if self._panning and event.button() == self._pan_button:
@@ -438,15 +1187,15 @@ class PDFView(QtWidgets.QGraphicsView):
                 self.controller._update_pdf_cursor()
             event.accept()
             return
-        if self._rubber.isVisible():
-            geo = self._rubber.geometry()
-            self._rubber.hide()
-            # map rubberband rect to scene coordinates
-            p1 = self.mapToScene(geo.topLeft())
-            p2 = self.mapToScene(geo.bottomRight())
-            rect = QtCore.QRectF(p1, p2).toRect()
-            # rect is already a QRect; emit directly
-            self.rectPicked.emit(rect)
+        if self._picking and event.button() == QtCore.Qt.MouseButton.LeftButton:
+            self._picking = False
+            # the band is cleared by the base release handler, so read it first
+            geo = self.rubberBandRect()
+            super().mouseReleaseEvent(event)
+            if not geo.isNull():
+                # map rubberband rect to scene coordinates
+                rect = self.mapToScene(geo).boundingRect().toRect()
+                self.rectPicked.emit(rect)
         else:
             # Click selection: emit balloonClicked(fid) when user clicks a balloon (not in pick-on-print)
             if event.button() == QtCore.Qt.MouseButton.LeftButton:
@@ -530,6 +1279,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle('Axis')
         self.pdf_path = None
         self.doc = None
+        self._doc_mtime = None
         self.current_page = 0
         self.mode = 'Ballooning'  # or 'Inspection'
         self.pick_on_print = False
@@ -537,7 +1287,22 @@ class MainWindow(QtWidgets.QMainWindow):
         self.current_wo = None
         # initialize rows to avoid attribute error before first load
         self.rows = []
+        self._rows_by_id: dict[str, dict] = {}
+        self._rows_by_page: dict[int, list[dict]] = {}
+        # lowercased method -> rows, in self.rows order; built on demand by _rows_with_method
+        self._rows_by_method: dict[str, list[dict]] | None = None
+        # stripped method -> number of rows using it, and feature id -> the method it was counted under;
+        # kept current on single edits, rebuilt after _methods_changed
+        self._method_counts: dict[str, int] | None = None
+        self._counted_methods: dict[str, str] = {}
+        self._used_method_cache: frozenset[str] | None = None
         self.balloon_items = []
+        self._item_by_id: dict[str, BalloonItem] = {}
+        # hidden items kept under the balloon layer for reuse on the next page
+        self._balloon_pool: list[BalloonItem] = []
+        # the one balloon drawn above the dimmed balloon layer
+        self._selected_balloon_item: BalloonItem | None = None
+        self._balloon_layer = None
         self.highlight_rect = None
         self.selected_feature_id = None
         self.default_balloon_radius = BALLOON_RADIUS
@@ -549,15 +1314,65 @@ class MainWindow(QtWidgets.QMainWindow):
         self.page_spin = None
         self.total_pages = 0
         self.method_options = ['CMM', 'Pin Gage', 'Visual']
+        self._method_choices = list(self.method_options)
+        self._method_model = QtCore.QStringListModel([''] + self._method_choices, self)
+        self._filter_methods: list[str] = []
+        self._method_signature: tuple[frozenset[str], tuple[str, ...]] | None = None
+        # set while a coalesced _refresh_method_combobox_options call is waiting on the event loop
+        self._methods_refresh_pending = False
         self._suppress_auto_focus = False
+        self._syncing_table_selection = False
         self._undo_stack = []
         self._undo_in_progress = False
         self._zoom_rerender_timer = QtCore.QTimer(self)  # [ZOOM-DEBOUNCE]
         self._zoom_rerender_timer.setSingleShot(True)  # [ZOOM-DEBOUNCE]
         self._zoom_rerender_timer.timeout.connect(self._zoom_rerender_timeout)  # [ZOOM-DEBOUNCE]
         self._pending_zoom_scale = None  # [ZOOM-DEBOUNCE]
+        # started with the first zoom step of a burst, so a long gesture still re-renders every max-wait interval
+        self._zoom_burst_clock = QtCore.QElapsedTimer()  # [ZOOM-DEBOUNCE]
         self._balloons_built_for_page = None  # [ZOOM-DEBOUNCE]
+        # feature edits are queued per id and written in one transaction when the timer fires
+        self._pending_updates: dict[str, dict] = {}
+        # work order -> {fid: {'result'/'notes': value}}, written together with the feature edits
+        self._pending_results: dict[str, dict[str, dict]] = {}
+        # (pdf, work order) -> [database mtime, results, notes]
+        self._wo_cache: dict[tuple[str, str], list] = {}
+        self._pending_updates_timer = QtCore.QTimer(self)
+        self._pending_updates_timer.setSingleShot(True)
+        self._pending_updates_timer.setInterval(500)
+        self._pending_updates_timer.timeout.connect(self._flush_pending_updates)
+        # one debounce timer for all dragged balloons instead of a QTimer per BalloonItem
+        self._dirty_balloons: set[BalloonItem] = set()
+        self._balloon_persist_timer = QtCore.QTimer(self)
+        self._balloon_persist_timer.setSingleShot(True)
+        self._balloon_persist_timer.setInterval(150)
+        self._balloon_persist_timer.timeout.connect(self._persist_dirty_balloons)
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.refresh_table)
+        self._page_cache: OrderedDict[tuple[int, float], QtGui.QPixmap] = OrderedDict()
+        self._page_cache_bytes = 0
+        self._pending_page_renders: set[tuple[int, float]] = set()
+        # bumped whenever the document is replaced, so renders of an earlier load (even of the same path) are dropped
+        self._doc_generation = 0
+        # page rects of the loaded document, read at open so the UI thread never takes _FITZ_LOCK for geometry
+        self._page_rects: list = []
+        # a page change asked for a store shrink that waits until the prefetch queue is empty
+        self._store_shrink_pending = False
+        # set by the first zoom gesture on the loaded document; zoom buckets are only prefetched after that
+        self._user_zoomed = False
+        self._awaited_render = None  # (cache key, render_scale) the view is waiting on
+        self._render_pool = QtCore.QThreadPool(self)
+        self._prefetch_from_page: int | None = None
+        self._render_pool.setMaxThreadCount(1)
+        self._render_signals = PageRenderSignals(self)
+        self._render_signals.rendered.connect(self._page_rendered)
+        self._open_signals = PdfOpenSignals(self)
+        self._open_signals.opened.connect(self._pdf_opened)
+        self._opening_path: str | None = None
         self.popout_win = None
+        self._table_dirty = False
         self._layout_pref = LAYOUT_HORIZONTAL
         self._split_orientation = QtCore.Qt.Orientation.Horizontal
         self._table_panel = None
@@ -686,21 +1501,26 @@ class MainWindow(QtWidgets.QMainWindow):
         self.method_filter.setInsertPolicy(QtWidgets.QComboBox.InsertPolicy.NoInsert)
         self.method_filter.setSizeAdjustPolicy(QtWidgets.QComboBox.SizeAdjustPolicy.AdjustToContents)
         self.method_filter.addItem('All')
-        self.method_filter.currentTextChanged.connect(self.refresh_table)
+        self.method_filter.currentTextChanged.connect(self._schedule_filter_refresh)
         filter_layout.addWidget(self.method_filter)
         filter_layout.addWidget(QtWidgets.QLabel('Status:'))
         self.status_filter = QtWidgets.QComboBox()
         self.status_filter.addItems(['All', 'PASS', 'FAIL', '—'])
-        self.status_filter.currentTextChanged.connect(self.refresh_table)
+        self.status_filter.currentTextChanged.connect(self._schedule_filter_refresh)
         filter_layout.addWidget(self.status_filter)
         lv.addLayout(filter_layout)
 
-        self.table = QtWidgets.QTableWidget(0, 10)
-        self.table.setHorizontalHeaderLabels(['ID', 'Page', 'Method', 'User', 'Result', 'Nominal', 'LSL', 'USL', 'Notes', 'Status'])
+        self.table = QtWidgets.QTableView()
+        self._table_model = FeatureTableModel(self.table)
+        self.table.setModel(self._table_model)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
-        self.table.cellChanged.connect(self.table_cell_changed)
-        self.table.itemSelectionChanged.connect(self._table_selection_changed)
+        # ctrl/shift selections let the context menu delete several balloons at once
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.table.setItemDelegateForColumn(self.COL_METHOD, MethodDelegate(self, self.table))
+        # uniform row heights let the view lay out rows without asking the model for size hints
+        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        self._table_model.cellEdited.connect(self.table_cell_changed)
+        self.table.selectionModel().selectionChanged.connect(self._table_selection_model_changed)
         self.table.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self._table_context_menu)
         lv.addWidget(self.table)
@@ -716,6 +1536,22 @@ class MainWindow(QtWidgets.QMainWindow):
         self._update_balloon_size_controls_enabled()
         self._update_page_controls_enabled()
 
+    def showEvent(self, event: QtGui.QShowEvent):
+        super().showEvent(event)
+        if self._table_dirty:
+            self.refresh_table()
+
+    def closeEvent(self, event: QtGui.QCloseEvent):
+        self._flush_pending_updates()
+        if self.doc:
+            try:
+                with _FITZ_LOCK:
+                    self.doc.close()
+            except Exception:
+                pass
+            self.doc = None
+        super().closeEvent(event)
+
     def _read_recent_files(self) -> list[str]:
         try:
             with RECENT_STORE_PATH.open('r', encoding='utf-8') as handle:
@@ -833,7 +1669,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self._write_recent_files()
             self._populate_recent_menu()
             return
-        self._load_pdf(str(target))
+        self._open_pdf_async(str(target))
 
     def _clear_recent_files(self) -> None:
         if not self._recent_files:
@@ -842,28 +1678,35 @@ class MainWindow(QtWidgets.QMainWindow):
         self._write_recent_files()
         self._populate_recent_menu()
 
+    def _schedule_filter_refresh(self, *_args):
+        # coalesce bursts of filter changes into a single table rebuild
+        self._filter_timer.start()
+
     def refresh_table(self):
         table = getattr(self, 'table', None)
-        if table is None:
+        model = getattr(self, '_table_model', None)
+        if table is None or model is None:
             return
-        try:
-            table.blockSignals(True)
-        except RuntimeError:
+        # a direct rebuild already honours the current filters
+        self._filter_timer.stop()
+        if not table.isVisible():
+            # nothing on screen to update yet; showEvent rebuilds once the window appears
+            self._table_dirty = True
             return
-        table.setRowCount(0)
+        self._table_dirty = False
         use_inspection_notes = self.mode == 'Inspection' and bool(self.current_wo)
-        wo_results = read_wo(self.pdf_path, self.current_wo) if use_inspection_notes else {}
-        wo_notes = read_wo_notes(self.pdf_path, self.current_wo) if use_inspection_notes else {}
-        for r in self.rows:
+        wo_results, wo_notes = self._workorder_entries() if use_inspection_notes else ({}, {})
+        features = []
+        results = []
+        notes = []
+        statuses = []
+        # read the filter combos once; the method test runs before any status work
+        sel_status, sel_method = self._table_filter_selection()
+        ballooning = self.mode == 'Ballooning'
+        source = self.rows if sel_method is None else self._rows_with_method(sel_method)
+        for r in source:
             id_ = r.get('id', '')
-            page = str(r.get('page', ''))
-            method = r.get('method', '')
-            nom = r.get('nominal', '')
-            lsl = r.get('lsl', '')
-            usl = r.get('usl', '')
-            creator = r.get('username', '')
-            status = '—'
-            if self.mode == 'Ballooning':
+            if ballooning:
                 # no persistent result; editable cell used for auto-fill only
                 result = ''
             else:
@@ -872,96 +1715,85 @@ class MainWindow(QtWidgets.QMainWindow):
                 note = wo_notes.get(id_, '')
             else:
                 note = ''
-            # determine status
-            try:
-                if result.upper() == 'PASS':
-                    status = 'PASS'
-                elif result.upper() == 'FAIL':
-                    status = 'FAIL'
-                else:
-                    if result != '' and nom != '' and lsl != '' and usl != '':
-                        val = float(result)
-                        if float(lsl) <= val <= float(usl):
-                            status = 'PASS'
-                        else:
-                            status = 'FAIL'
-            except Exception:
-                status = '—'
-
-            # status filter
-            sel_status = self.status_filter.currentText() if self.status_filter else 'All'
-            if sel_status != 'All' and status != sel_status:
+            status = compute_status(result.strip(), r.get('lsl', '').strip(), r.get('usl', '').strip()) if result else '—'
+            if sel_status is not None and status != sel_status:
                 continue
 
-            # method filter
-            sel_method = self.method_filter.currentText() if isinstance(self.method_filter, QtWidgets.QComboBox) else 'All'
-            if sel_method not in ('All', ''):
-                method_value = (method or '').strip()
-                if method_value.lower() != sel_method.lower():
-                    continue
+            features.append(r)
+            results.append(result)
+            notes.append(note)
+            statuses.append(status)
 
-            row = table.rowCount()
-            table.insertRow(row)
-            # helper to set read-only/ editable
-            def make_item(text: str, editable: bool):
-                it = QtWidgets.QTableWidgetItem(text)
-                if not editable:
-                    it.setFlags(it.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
-                return it
-
-            self.table.setItem(row, self.COL_ID, make_item(id_, False))
-            self.table.setItem(row, self.COL_PAGE, make_item(page, False))
-            can_edit_specs = (self.mode == 'Ballooning')
-            method_item = make_item(method, False)
-            self.table.setItem(row, self.COL_METHOD, method_item)
-            combo = QtWidgets.QComboBox()
-            combo.setEditable(False)
-            combo.setInsertPolicy(QtWidgets.QComboBox.InsertPolicy.NoInsert)
-            combo.setSizeAdjustPolicy(QtWidgets.QComboBox.SizeAdjustPolicy.AdjustToContents)
-            combo.setStyleSheet(
-                "QComboBox { color: rgb(235, 235, 235); } "
-                "QComboBox::drop-down { border: none; } "
-                "QComboBox:disabled { color: rgb(225, 225, 225); background-color: rgb(45, 45, 45); }"
+        # the model reset and the selection restore then share one repaint
+        table.setUpdatesEnabled(False)
+        try:
+            model.set_rows(
+                features,
+                results,
+                notes,
+                statuses,
+                specs_editable=(self.mode == 'Ballooning'),
+                notes_editable=use_inspection_notes,
+                show_creator=(self.mode == 'Ballooning'),
             )
-            combo.addItems([''] + self.method_options)
-            combo.setCurrentText(method)
-            combo.setEnabled(self.mode == 'Ballooning')
-            combo.currentTextChanged.connect(partial(self._method_combo_changed, row))
-            self.table.setCellWidget(row, self.COL_METHOD, combo)
-            has_result = bool((result or '').strip())
-            display_user = creator if self.mode == 'Ballooning' or has_result else ''
-            self.table.setItem(row, self.COL_USERNAME, make_item(display_user, False))
-            itm_result = QtWidgets.QTableWidgetItem(result)
-            # Result editable in both modes (Ballooning: used for tol autofill; Inspection: writes to WO)
-            itm_result.setFlags(itm_result.flags() | QtCore.Qt.ItemFlag.ItemIsEditable)
-            table.setItem(row, self.COL_RESULT, itm_result)
-            table.setItem(row, self.COL_NOMINAL, make_item(nom, can_edit_specs))
-            table.setItem(row, self.COL_LSL, make_item(lsl, can_edit_specs))
-            table.setItem(row, self.COL_USL, make_item(usl, can_edit_specs))
-            note_item = QtWidgets.QTableWidgetItem(note)
-            if use_inspection_notes:
-                note_item.setFlags(note_item.flags() | QtCore.Qt.ItemFlag.ItemIsEditable)
-            else:
-                note_item.setFlags(note_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
-            table.setItem(row, self.COL_NOTES, note_item)
-            table.setItem(row, self.COL_STATUS, make_item(status, False))
-            self._apply_status_formatting(row, status)
+            self._queue_methods_refresh()
+            self._sync_table_selection()
+        finally:
+            table.setUpdatesEnabled(True)
+
+    def _workorder_entries(self) -> tuple[dict, dict]:
+        """Results and notes of the current work order, read once and then kept in sync with our own writes.
+
+        The entry is re-read when the database changed behind our back (another station on a shared drive).
+        """
+        if not self.pdf_path or not self.current_wo:
+            return {}, {}
+        key = (self.pdf_path, self.current_wo)
+        mtime = db_mtime(self.pdf_path)
+        cached = self._wo_cache.get(key)
+        if cached is None or cached[0] != mtime:
+            cached = [mtime, read_wo(self.pdf_path, self.current_wo), read_wo_notes(self.pdf_path, self.current_wo)]
+            self._wo_cache[key] = cached
+            # edits still waiting for the flush are newer than what the database holds
+            for fid, entry in self._pending_results.get(self.current_wo, {}).items():
+                self._cache_workorder_entry(fid, **entry)
+        return cached[1], cached[2]
+
+    def _cache_workorder_entry(self, fid: str, *, result: str | None = None, notes: str | None = None):
+        cached = self._wo_cache.get((self.pdf_path, self.current_wo))
+        if cached is None:
+            return
+        _, results, notes_map = cached
+        # mirror batch_upsert_results: a new row gets empty strings for the column not written
+        if result is not None:
+            results[fid] = result
+            notes_map.setdefault(fid, '')
+        if notes is not None:
+            notes_map[fid] = notes
+            results.setdefault(fid, '')
+
+    def _table_filter_selection(self) -> tuple[str | None, str | None]:
+        """(status, lowercased method) the table is filtered to; None where the filter is 'All'."""
+        sel_status = self.status_filter.currentText() if self.status_filter else 'All'
+        sel_method = self.method_filter.currentText() if isinstance(self.method_filter, QtWidgets.QComboBox) else 'All'
+        return (
+            None if sel_status == 'All' else sel_status,
+            None if sel_method in ('All', '') else sel_method.lower(),
+        )
 
-        self._refresh_method_combobox_options()
+    def _passes_table_filters(self, method: str, status: str) -> bool:
+        sel_status, sel_method = self._table_filter_selection()
+        if sel_status is not None and status != sel_status:
+            return False
+        if sel_method is not None and (method or '').strip().lower() != sel_method:
+            return False
+        return True
 
-        try:
-            table.blockSignals(False)
-        except RuntimeError:
-            return
+    def _sync_table_selection(self):
         if self.selected_feature_id:
-            target_row = None
-            for idx in range(table.rowCount()):
-                item = table.item(idx, self.COL_ID)
-                if item and item.text() == self.selected_feature_id:
-                    target_row = idx
-                    break
-            if target_row is not None:
-                table.selectRow(target_row)
+            target_row = self._table_model.row_of(self.selected_feature_id)
+            if target_row >= 0:
+                self.table.selectRow(target_row)
                 return
             # selected feature no longer visible
             self.selected_feature_id = None
@@ -969,115 +1801,75 @@ class MainWindow(QtWidgets.QMainWindow):
         self._apply_balloon_selection_visuals()
         self._clear_highlight_rect()
 
+    def _append_table_row(self, feature: dict):
+        """Add a freshly picked feature to the table without rebuilding the other rows."""
+        # new balloons carry no result yet, so their status is always '—'
+        if self._passes_table_filters(feature.get('method', ''), '—'):
+            self._table_model.insert_row(self._table_model.rowCount(), feature)
+        self._sync_table_selection()
+
     def table_cell_changed(self, row, col):
         # handle edits per column without full-table refresh to avoid editor warnings
-        id_item = self.table.item(row, self.COL_ID)
-        if not id_item:
+        model = self._table_model
+        feature = model.feature_at(row)
+        if feature is None:
             return
-        fid = id_item.text()
+        fid = feature.get('id', '')
         if col == self.COL_RESULT:
-            val_item = self.table.item(row, col)
-            val = val_item.text() if val_item else ''
+            val = model.cell_text(row, col)
             normalized = self._normalize_result_entry(val)
-            if normalized != val and val_item:
-                try:
-                    self.table.blockSignals(True)
-                    val_item.setText(normalized)
-                finally:
-                    self.table.blockSignals(False)
+            if normalized != val:
+                model.set_cell(row, col, normalized)
                 val = normalized
             if self.mode == 'Ballooning':
-                # auto-fill tolerances if empty
-                for r in self.rows:
-                    if r.get('id') == fid:
-                        nom = r.get('nominal', '')
-                        lsl = r.get('lsl', '')
-                        usl = r.get('usl', '')
-                        if not nom and not lsl and not usl and val.strip():
-                            try:
-                                nomv, lslv, uslv = parse_tolerance_expression(val)
-                                formatted_nom = format_number(nomv)
-                                formatted_lsl = format_number(lslv)
-                                formatted_usl = format_number(uslv)
-                                update_feature(self.pdf_path, fid, {
-                                    "nominal": formatted_nom,
-                                    "lsl": formatted_lsl,
-                                    "usl": formatted_usl,
-                                })
-                                r['nominal'] = formatted_nom
-                                r['lsl'] = formatted_lsl
-                                r['usl'] = formatted_usl
-                                self.table.blockSignals(True)
-                                self.table.item(row, self.COL_RESULT).setText('')
-                                self.table.item(row, self.COL_NOMINAL).setText(formatted_nom)
-                                self.table.item(row, self.COL_LSL).setText(formatted_lsl)
-                                self.table.item(row, self.COL_USL).setText(formatted_usl)
-                                self.table.blockSignals(False)
-                            except Exception:
-                                pass
-                        break
+                # auto-fill tolerances if empty (the model row holds the same dict as self.rows)
+                if val.strip() and not (feature.get('nominal') or feature.get('lsl') or feature.get('usl')):
+                    try:
+                        parsed = parse_tolerance(val)
+                    except Exception:
+                        parsed = None
+                    if parsed is not None:
+                        model.set_cell(row, self.COL_RESULT, '')
+                        self._apply_tolerance_values(row, fid, feature, parsed)
             else:
                 # Inspection: write result and recompute status for this row
-                upsert_result_entry(self.pdf_path, self.current_wo, fid, result=val)
-                inspector = (current_username() or '').strip()
-                if inspector and self.pdf_path:
-                    update_feature(self.pdf_path, fid, {'username': inspector})
-                for r in self.rows:
-                    if r.get('id') == fid:
-                        r['username'] = inspector
-                        break
-                user_item = self.table.item(row, self.COL_USERNAME)
-                if user_item is None:
-                    user_item = QtWidgets.QTableWidgetItem(inspector)
-                    user_item.setFlags(user_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
-                    try:
-                        self.table.blockSignals(True)
-                        self.table.setItem(row, self.COL_USERNAME, user_item)
-                    finally:
-                        self.table.blockSignals(False)
-                else:
-                    try:
-                        self.table.blockSignals(True)
-                        user_item.setText(inspector)
-                    finally:
-                        self.table.blockSignals(False)
+                stored_results, _ = self._workorder_entries()
+                if stored_results.get(fid) != val:
+                    # e.g. 'p' typed over 'Pass' normalizes back to the stored value; nothing to write then
+                    self._queue_result_update(fid, result=val)
+                    inspector = (current_username() or '').strip()
+                    if inspector:
+                        self._queue_feature_update(fid, {'username': inspector})
+                    feature['username'] = inspector
                 self._recompute_row_status(row)
             self._advance_result_edit(row)
             return
         if col == self.COL_NOTES:
-            note_item = self.table.item(row, col)
-            note_value = note_item.text() if note_item else ''
+            note_value = model.cell_text(row, col)
             if self.mode != 'Inspection' or not self.current_wo:
-                try:
-                    self.table.blockSignals(True)
-                    if note_item:
-                        note_item.setText('')
-                finally:
-                    self.table.blockSignals(False)
+                model.set_cell(row, col, '')
                 return
-            upsert_result_entry(self.pdf_path, self.current_wo, fid, notes=note_value)
+            self._queue_result_update(fid, notes=note_value)
             return
         if self.mode == 'Ballooning' and col == self.COL_NOMINAL:
-            text_item = self.table.item(row, col)
-            text_value = text_item.text() if text_item else ''
+            text_value = model.cell_text(row, col)
             if self._try_apply_tolerance_entry(row, fid, text_value):
                 return
         # Ballooning: editing Method/Nom/LSL/USL persists to master
         if self.mode == 'Ballooning' and col in (self.COL_METHOD, self.COL_NOMINAL, self.COL_LSL, self.COL_USL):
-            item_ref = self.table.item(row, col)
-            text = item_ref.text() if item_ref else ''
+            text = model.cell_text(row, col)
             key = {
                 self.COL_METHOD: 'method',
                 self.COL_NOMINAL: 'nominal',
                 self.COL_LSL: 'lsl',
                 self.COL_USL: 'usl',
             }[col]
-            update_feature(self.pdf_path, fid, {key: text})
-            for r in self.rows:
-                if r.get('id') == fid:
-                    r[key] = text
-                    break
+            self._queue_feature_update(fid, {key: text})
+            feature[key] = text
             if col == self.COL_METHOD:
+                self._method_edited(fid, text)
+                # refreshed right away so the filter never lags a method the user just typed; with the
+                # incremental counts this is a signature compare unless the set of used methods changed
                 self._refresh_method_combobox_options()
             self._recompute_row_status(row)
             return
@@ -1090,97 +1882,37 @@ class MainWindow(QtWidgets.QMainWindow):
         if table is None:
             return
         next_row = current_row + 1
-        while next_row < table.rowCount():
-            next_item = table.item(next_row, self.COL_RESULT)
-            if next_item is not None:
-                table.setCurrentCell(next_row, self.COL_RESULT)
-
-                def _start_edit(target_row=next_row):
-                    table_ref = getattr(self, 'table', None)
-                    if table_ref is None:
-                        return
-                    if target_row < 0 or target_row >= table_ref.rowCount():
-                        return
-                    item_ref = table_ref.item(target_row, self.COL_RESULT)
-                    if item_ref is None:
-                        return
-                    try:
-                        table_ref.editItem(item_ref)
-                    except Exception:
-                        pass
+        if next_row >= self._table_model.rowCount():
+            return
+        table.setCurrentIndex(self._table_model.index(next_row, self.COL_RESULT))
 
-                QtCore.QTimer.singleShot(0, _start_edit)
-                break
-            next_row += 1
+        def _start_edit(target_row=next_row):
+            table_ref = getattr(self, 'table', None)
+            if table_ref is None:
+                return
+            if target_row < 0 or target_row >= self._table_model.rowCount():
+                return
+            try:
+                table_ref.edit(self._table_model.index(target_row, self.COL_RESULT))
+            except Exception:
+                pass
+
+        QtCore.QTimer.singleShot(0, _start_edit)
 
 
     def _recompute_row_status(self, row: int):
-        if row < 0 or row >= self.table.rowCount():
+        model = self._table_model
+        if row < 0 or row >= model.rowCount():
             return
-        result_item = self.table.item(row, self.COL_RESULT)
-        nom_item = self.table.item(row, self.COL_NOMINAL)
-        lsl_item = self.table.item(row, self.COL_LSL)
-        usl_item = self.table.item(row, self.COL_USL)
-        status_item = self.table.item(row, self.COL_STATUS)
-
-        result_text = result_item.text().strip() if result_item else ''
-        nom_text = nom_item.text().strip() if nom_item else ''
-        lsl_text = lsl_item.text().strip() if lsl_item else ''
-        usl_text = usl_item.text().strip() if usl_item else ''
+        result_text = model.cell_text(row, self.COL_RESULT).strip()
+        lsl_text = model.cell_text(row, self.COL_LSL).strip()
+        usl_text = model.cell_text(row, self.COL_USL).strip()
 
         status = self._status_from_fields(result_text, lsl_text, usl_text)
-
-        if status_item:
-            self.table.blockSignals(True)
-            status_item.setText(status)
-            self.table.blockSignals(False)
-        self._apply_status_formatting(row, status)
+        model.set_status(row, status)
 
     def _status_from_fields(self, result_text: str, lsl_text: str, usl_text: str) -> str:
-        if not result_text:
-            return '—'
-        upper = result_text.upper()
-        if upper in ('PASS', 'FAIL'):
-            return upper
-        try:
-            value = float(result_text)
-            lsl_val = float(lsl_text) if lsl_text else None
-            usl_val = float(usl_text) if usl_text else None
-            if lsl_val is None or usl_val is None:
-                return '—'
-            return 'PASS' if lsl_val <= value <= usl_val else 'FAIL'
-        except Exception:
-            return '—'
-
-    def _apply_status_formatting(self, row: int, status: str):
-        table = getattr(self, 'table', None)
-        if table is None or row < 0 or row >= table.rowCount():
-            return
-        palette = {
-            'PASS': QtGui.QColor(200, 235, 200),
-            'FAIL': QtGui.QColor(247, 205, 205),
-            '—': QtGui.QColor(235, 235, 235),
-        }
-        text_colors = {
-            'PASS': QtGui.QColor(10, 80, 10),
-            'FAIL': QtGui.QColor(140, 20, 20),
-            '—': QtGui.QColor(200, 200, 200),
-        }
-        bold_status = status in ('PASS', 'FAIL')
-        color = palette.get(status.upper() if isinstance(status, str) else status)
-        text_color = text_colors.get(status.upper() if isinstance(status, str) else status, QtGui.QColor(220, 220, 220))
-        for col in (self.COL_RESULT, self.COL_STATUS):
-            item = table.item(row, col)
-            if not item:
-                continue
-            if color:
-                item.setBackground(QtGui.QBrush(color))
-            else:
-                item.setBackground(QtGui.QBrush())
-            item.setForeground(QtGui.QBrush(text_color))
-            font = item.font()
-            font.setBold(bold_status)
-            item.setFont(font)
+        return compute_status(result_text, lsl_text, usl_text)
 
     def _normalize_result_entry(self, value: str) -> str:
         if value is None:
@@ -1195,65 +1927,41 @@ class MainWindow(QtWidgets.QMainWindow):
             return 'FAIL'
         return stripped
 
-    def _string_has_tolerance(self, text: str) -> bool:
-        if not text:
-            return False
-        normalized = normalize_str(text)
-        if not normalized:
-            return False
-        lowered = normalized.lower()
-        if any(token in lowered for token in ('±', '+/-', '-/+', '+-', '-+')):
-            return True
-        plus_pos = normalized.find('+', 1)
-        if plus_pos != -1:
-            return True
-        minus_count = normalized.count('-')
-        if normalized.startswith('-'):
-            minus_count -= 1
-        return minus_count > 1
-
     def _try_apply_tolerance_entry(self, row: int, fid: str, text: str) -> bool:
         if not text:
             return False
         candidate = normalize_str(text)
-        if not self._string_has_tolerance(candidate):
+        if not string_has_tolerance(candidate):
             return False
         try:
-            nomv, lslv, uslv = parse_tolerance_expression(candidate)
+            parsed = parse_tolerance(candidate)
         except Exception:
             return False
-        formatted_nom = format_number(nomv)
-        formatted_lsl = format_number(lslv)
-        formatted_usl = format_number(uslv)
+        return self._apply_tolerance_values(row, fid, self._rows_lookup(fid), parsed)
+
+    def _apply_tolerance_values(self, row: int, fid: str, feature: dict | None, parsed: tuple) -> bool:
+        """Store parsed (nominal, lsl, usl) on a feature, queue the write and refresh its table row."""
+        nomv, lslv, uslv = parsed
         updates = {
-            'nominal': formatted_nom,
-            'lsl': formatted_lsl,
-            'usl': formatted_usl,
+            'nominal': format_number(nomv),
+            'lsl': format_number(lslv),
+            'usl': format_number(uslv),
         }
-        if self.pdf_path:
-            update_feature(self.pdf_path, fid, updates)
-        for r in self.rows:
-            if r.get('id') == fid:
-                r.update(updates)
-                break
-        table = getattr(self, 'table', None)
-        if table is None:
+        self._queue_feature_update(fid, updates)
+        if feature is not None:
+            feature.update(updates)
+        model = getattr(self, '_table_model', None)
+        if model is None:
             return False
-        try:
-            table.blockSignals(True)
-            for col, value in ((self.COL_NOMINAL, formatted_nom), (self.COL_LSL, formatted_lsl), (self.COL_USL, formatted_usl)):
-                item = table.item(row, col)
-                if item is None:
-                    item = QtWidgets.QTableWidgetItem(value)
-                    item.setFlags(item.flags() | QtCore.Qt.ItemFlag.ItemIsEditable)
-                    table.setItem(row, col, item)
-                else:
-                    item.setText(value)
-        finally:
-            table.blockSignals(False)
+        model.refresh_row(row)
         self._recompute_row_status(row)
         return True
 
+    def _table_selection_model_changed(self, _selected=None, _deselected=None):
+        if self._syncing_table_selection:
+            return
+        self._table_selection_changed()
+
     def _table_selection_changed(self):
         if not self.pdf_path:
             return
@@ -1264,48 +1972,30 @@ class MainWindow(QtWidgets.QMainWindow):
         if selected_rows:
             row = selected_rows[0].row()
         else:
-            row = self.table.currentRow()
+            row = self.table.currentIndex().row()
             if row < 0:
                 self.selected_feature_id = None
                 self._apply_balloon_selection_visuals()
                 self._clear_highlight_rect()
                 return
-        id_item = self.table.item(row, self.COL_ID)
-        if not id_item:
-            return
-        fid = id_item.text()
-        feature = None
-        for r in self.rows:
-            if r.get('id') == fid:
-                feature = r
-                break
+        feature = self._table_model.feature_at(row)
         if not feature:
             return
+        fid = feature.get('id', '')
         if self._suppress_auto_focus:
             self._suppress_auto_focus = False
             self.selected_feature_id = fid
             self._apply_balloon_selection_visuals()
-            try:
-                x = float(feature.get('x', 0))
-                y = float(feature.get('y', 0))
-                w = float(feature.get('w', 0))
-                h = float(feature.get('h', 0))
-            except Exception:
-                self._clear_highlight_rect()
-                # continue to focus even when auto-focus was suppressed
-            rect_item = self._ensure_highlight_rect()
+            rect = feature_rect(feature)
+            rect_item = self._ensure_highlight_rect() if rect is not None else None
             if rect_item is not None:
-                rect_item.setRect(QtCore.QRectF(x, y, w, h))
+                rect_item.setRect(QtCore.QRectF(*rect))
                 rect_item.setVisible(True)
             else:
                 self._clear_highlight_rect()
             # proceed to page sync + zoom/center
         self.selected_feature_id = fid
-        try:
-            page_idx = int(feature.get('page', '1')) - 1
-        except Exception:
-            page_idx = 0
-        page_idx = max(0, page_idx)
+        page_idx = max(0, feature_page_index(feature))
         if page_idx != self.current_page:
             self._balloons_built_for_page = None  # [ZOOM-DEBOUNCE]
             self.current_page = page_idx
@@ -1328,40 +2018,47 @@ class MainWindow(QtWidgets.QMainWindow):
         row = table.rowAt(pos.y())
         if row < 0:
             return
-        table.selectRow(row)
+        selected = sorted(index.row() for index in table.selectionModel().selectedRows())
+        if row not in selected:
+            table.selectRow(row)
+            selected = [row]
         menu = QtWidgets.QMenu(self)
-        delete_action = menu.addAction('Delete Balloon')
+        delete_action = menu.addAction('Delete Balloon' if len(selected) == 1 else f'Delete {len(selected)} Balloons')
         global_pos = table.viewport().mapToGlobal(pos)
         chosen = menu.exec(global_pos)
         if chosen == delete_action:
-            self._delete_balloon_row(row)
+            self._delete_balloon_rows(selected)
 
-    def _delete_balloon_row(self, row: int):
+    def _delete_balloon_rows(self, rows: list[int]):
         if self.mode != 'Ballooning' or not self.pdf_path:
             return
-        table = getattr(self, 'table', None)
-        if table is None or row < 0 or row >= table.rowCount():
-            return
-        id_item = table.item(row, self.COL_ID)
-        if not id_item:
-            return
-        fid = id_item.text().strip()
-        if not fid:
+        model = self._table_model
+        fids = []
+        for row in rows:
+            feature = model.feature_at(row)
+            fid = (feature.get('id') or '').strip() if feature is not None else ''
+            if fid:
+                fids.append(fid)
+        if not fids:
             return
+        prompt = f'Remove balloon {fids[0]}?' if len(fids) == 1 else f'Remove {len(fids)} balloons ({", ".join(fids)})?'
         confirm = QtWidgets.QMessageBox.question(
             self,
             'Delete Balloon',
-            f'Remove balloon {fid}?',
+            prompt,
             QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No,
             QtWidgets.QMessageBox.StandardButton.No,
         )
         if confirm != QtWidgets.QMessageBox.StandardButton.Yes:
             return
 
-        snapshot = self._remove_feature(fid, row_hint=row)
-        if snapshot:
-            self._push_undo(lambda snap=snapshot: self._undo_deleted_feature(snap), f'Delete {fid}')
-            self.statusBar().showMessage(f'Deleted {fid}', 3000)
+        snapshots = self._remove_features(fids, row_hint=min(rows))
+        if not snapshots:
+            return
+        label = snapshots[0]['id'] if len(snapshots) == 1 else f'{len(snapshots)} balloons'
+        # one undo step brings the whole selection back
+        self._push_undo(lambda snaps=snapshots: self._undo_deleted_features(snaps), f'Delete {label}')
+        self.statusBar().showMessage(f'Deleted {label}', 3000)
 
     def _balloon_clicked(self, fid: str):
         # Select the checklist row matching fid and focus on it
@@ -1370,73 +2067,55 @@ class MainWindow(QtWidgets.QMainWindow):
         table = getattr(self, 'table', None)
         if table is None:
             return
+        model = self._table_model
         # Try to find row under current filters
-        target_row = -1
-        for row in range(table.rowCount()):
-            id_item = table.item(row, self.COL_ID)
-            if id_item and id_item.text().strip() == fid:
-                target_row = row
-                break
+        target_row = model.row_of(fid)
         # If not found (likely filtered out), temporarily clear filters and refresh
         if target_row < 0:
             prev_method = self.method_filter.currentText() if isinstance(self.method_filter, QtWidgets.QComboBox) else 'All'
             prev_status = self.status_filter.currentText() if isinstance(self.status_filter, QtWidgets.QComboBox) else 'All'
             try:
                 if isinstance(self.method_filter, QtWidgets.QComboBox):
-                    self.method_filter.blockSignals(True)
-                    self.method_filter.setCurrentText('All')
-                    self.method_filter.blockSignals(False)
+                    with QtCore.QSignalBlocker(self.method_filter):
+                        self.method_filter.setCurrentText('All')
                 if isinstance(self.status_filter, QtWidgets.QComboBox):
-                    self.status_filter.blockSignals(True)
-                    self.status_filter.setCurrentText('All')
-                    self.status_filter.blockSignals(False)
+                    with QtCore.QSignalBlocker(self.status_filter):
+                        self.status_filter.setCurrentText('All')
             except Exception:
                 pass
             self.refresh_table()
-            for row in range(table.rowCount()):
-                id_item = table.item(row, self.COL_ID)
-                if id_item and id_item.text().strip() == fid:
-                    target_row = row
-                    break
+            target_row = model.row_of(fid)
             # Restore previous filters if desired; keep selection visible by leaving as-is
             try:
                 if isinstance(self.method_filter, QtWidgets.QComboBox):
-                    self.method_filter.blockSignals(True)
-                    self.method_filter.setCurrentText(prev_method)
-                    self.method_filter.blockSignals(False)
+                    with QtCore.QSignalBlocker(self.method_filter):
+                        self.method_filter.setCurrentText(prev_method)
                 if isinstance(self.status_filter, QtWidgets.QComboBox):
-                    self.status_filter.blockSignals(True)
-                    self.status_filter.setCurrentText(prev_status)
-                    self.status_filter.blockSignals(False)
+                    with QtCore.QSignalBlocker(self.status_filter):
+                        self.status_filter.setCurrentText(prev_status)
             except Exception:
                 pass
             if target_row < 0:
                 return
+        self._syncing_table_selection = True
         try:
-            table.blockSignals(True)
-            table.selectRow(target_row)
-            table.blockSignals(False)
-        except Exception:
             table.selectRow(target_row)
+        finally:
+            self._syncing_table_selection = False
         # Ensure row is centered in view
-        id_item = table.item(target_row, self.COL_ID)
-        if id_item:
-            table.scrollToItem(id_item, QtWidgets.QAbstractItemView.ScrollHint.PositionAtCenter)
+        table.scrollTo(model.index(target_row, self.COL_ID), QtWidgets.QAbstractItemView.ScrollHint.PositionAtCenter)
         # Let _table_selection_changed handle page switch, focus, and highlight
 
     def _focus_on_feature(self, feature: dict):
         if not self.pdf_view._pixmap_item:
             return
+        zoom = max(self.pdf_view._min_scale, min(self.pdf_view._max_scale, feature_zoom(feature)))
+        rect = feature_rect(feature)
+        if rect is None:
+            return
+        x, y, w, h = rect
+        # the offset is a float while a drag is pending and a string once persisted, so it is read as-is
         try:
-            zoom = float(feature.get('zoom') or 1.0)
-        except Exception:
-            zoom = 1.0
-        zoom = max(self.pdf_view._min_scale, min(self.pdf_view._max_scale, zoom))
-        try:
-            x = float(feature.get('x', 0))
-            y = float(feature.get('y', 0))
-            w = float(feature.get('w', 0))
-            h = float(feature.get('h', 0))
             bx = float(feature.get('bx', 0))
             by = float(feature.get('by', 0))
         except Exception:
@@ -1457,98 +2136,85 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             self._clear_highlight_rect()
 
-    def _method_combo_changed(self, row: int, text: str):
-        table = getattr(self, 'table', None)
-        if table is None:
-            return
-        if row < 0 or row >= table.rowCount():
-            return
-        combo = table.cellWidget(row, self.COL_METHOD)
-        if isinstance(combo, QtWidgets.QComboBox) and not combo.isEnabled():
-            # keep combo text aligned with stored value when editing is disabled
-            item = table.item(row, self.COL_METHOD)
-            if item and combo.currentText() != item.text():
-                combo.blockSignals(True)
-                combo.setCurrentText(item.text())
-                combo.blockSignals(False)
-            return
-        item = table.item(row, self.COL_METHOD)
-        if not item:
-            return
-        if item.text() == text:
-            return
-        item.setText(text)
-        id_item = table.item(row, self.COL_ID)
-        fid = id_item.text() if id_item else None
-        if not fid:
-            return
-        if self.mode == 'Ballooning' and self.pdf_path:
-            update_feature(self.pdf_path, fid, {'method': text})
-            for r in self.rows:
-                if r.get('id') == fid:
-                    r['method'] = text
-                    break
-        self._refresh_method_combobox_options()
-        self._refresh_method_filter_options()
-
-    def _refresh_method_filter_options(self):
+    def _used_methods(self, methods: set[str] | None = None) -> list[str]:
+        if methods is None:
+            methods = self._used_method_set()
+        return sorted(methods, key=lambda s: (s.lower(), s))
+
+    def _used_method_set(self) -> frozenset[str]:
+        # refresh_table asks on every rebuild; the rows are only rescanned after _methods_changed
+        if self._used_method_cache is None:
+            counts = self._method_counts
+            if counts is None:
+                counts = {}
+                counted = {}
+                for row in self.rows:
+                    method = (row.get('method') or '').strip()
+                    counted[row.get('id')] = method
+                    if method:
+                        counts[method] = counts.get(method, 0) + 1
+                self._method_counts = counts
+                self._counted_methods = counted
+            self._used_method_cache = frozenset(counts)
+        return self._used_method_cache
+
+    def _refresh_method_filter_options(self, methods: list[str] | None = None):
         combo = getattr(self, 'method_filter', None)
         if not isinstance(combo, QtWidgets.QComboBox):
             return
-        methods = sorted(
-            {
-                (row.get('method') or '').strip()
-                for row in self.rows
-                if (row.get('method') or '').strip()
-            },
-            key=lambda s: s.lower()
-        )
+        if methods is None:
+            methods = self._used_methods()
+            # refreshed outside _refresh_method_combobox_options, so its cached signature no longer covers the filter
+            self._method_signature = None
+        if methods == self._filter_methods and combo.count() == len(methods) + 1:
+            return
+        self._filter_methods = list(methods)
         current = combo.currentText() if combo.count() else 'All'
-        combo.blockSignals(True)
-        combo.clear()
-        combo.addItem('All')
-        for value in methods:
-            combo.addItem(value)
-        if current and combo.findText(current, QtCore.Qt.MatchFlag.MatchExactly) >= 0:
-            combo.setCurrentText(current)
-        else:
-            combo.setCurrentIndex(0)
-        combo.blockSignals(False)
+        with QtCore.QSignalBlocker(combo):
+            combo.clear()
+            combo.addItems(['All'] + list(methods))
+            if current and combo.findText(current, QtCore.Qt.MatchFlag.MatchExactly) >= 0:
+                combo.setCurrentText(current)
+            else:
+                combo.setCurrentIndex(0)
+
+    def _queue_methods_refresh(self):
+        """Refresh the method combo and filter once control returns to the event loop, however many rebuilds asked.
+
+        Used by the bulk paths (table rebuilds, row loads, the method list dialog); a single method edit refreshes
+        immediately instead.
+        """
+        if self._methods_refresh_pending:
+            return
+        self._methods_refresh_pending = True
+        QtCore.QTimer.singleShot(0, self._run_methods_refresh)
+
+    def _run_methods_refresh(self):
+        self._methods_refresh_pending = False
+        self._refresh_method_combobox_options()
 
     def _refresh_method_combobox_options(self):
-        table = getattr(self, 'table', None)
-        if table is None:
+        used_set = self._used_method_set()
+        signature = (used_set, tuple(self.method_options))
+        if signature == self._method_signature:
+            # same methods in use and same configured list: combos and filter are already current
             return
+        self._method_signature = signature
+        used = self._used_methods(used_set)
         base = list(self.method_options)
         seen = {value.lower() for value in base}
         extras = []
-        for row in range(table.rowCount()):
-            item = table.item(row, self.COL_METHOD)
-            if not item:
-                continue
-            value = item.text().strip()
-            if not value:
-                continue
+        for value in used:
             key = value.lower()
             if key not in seen:
                 extras.append(value)
                 seen.add(key)
-        ordered_options = base + sorted(extras, key=lambda s: s.lower())
-        for row in range(table.rowCount()):
-            combo = table.cellWidget(row, self.COL_METHOD)
-            if not isinstance(combo, QtWidgets.QComboBox):
-                continue
-            current = combo.currentText()
-            combo.blockSignals(True)
-            combo.clear()
-            combo.addItem('')
-            for value in ordered_options:
-                combo.addItem(value)
-            combo.setCurrentText(current)
-            combo.setEnabled(self.mode == 'Ballooning')
-            combo.blockSignals(False)
-        self._refresh_method_filter_options()
-    
+        choices = base + extras
+        if choices != self._method_choices:
+            self._method_choices = choices
+            self._method_model.setStringList([''] + choices)
+        self._refresh_method_filter_options(used)
+
     def _edit_methods(self):
         dlg = MethodListDialog(self, self.method_options)
         if dlg.exec() != QtWidgets.QDialog.DialogCode.Accepted:
@@ -1558,7 +2224,7 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, 'Inspection Methods', 'At least one method is required.')
             return
         self.method_options = sorted(updated, key=lambda s: s.lower())
-        self._refresh_method_combobox_options()
+        self._queue_methods_refresh()
 
     def _shortcut_pick_mode(self):
         if self.mode != 'Ballooning' or not self.pdf_path:
@@ -1585,9 +2251,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def toggle_pick(self, checked: bool):
         if not self.pdf_path or self.mode != 'Ballooning':
-            self.pick_btn.blockSignals(True)
-            self.pick_btn.setChecked(False)
-            self.pick_btn.blockSignals(False)
+            with QtCore.QSignalBlocker(self.pick_btn):
+                self.pick_btn.setChecked(False)
             self.pick_on_print = False
             self._update_pdf_cursor()
             if not self.pdf_path:
@@ -1622,7 +2287,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # If a feature is selected, sync zoom/center immediately; else mirror main view transform
         feature = None
         if self.selected_feature_id:
-            feature = next((r for r in self.rows if r.get('id') == self.selected_feature_id), None)
+            feature = self._rows_lookup(self.selected_feature_id)
         if feature:
             try:
                 self._focus_on_feature(feature)
@@ -1645,12 +2310,15 @@ class MainWindow(QtWidgets.QMainWindow):
         view = getattr(self, 'pdf_view', None)
         if view is None:
             return
-        if self.pick_on_print and self.mode == 'Ballooning' and self.pdf_path:
+        pick_active = bool(self.pick_on_print and self.mode == 'Ballooning' and self.pdf_path)
+        view.set_pick_mode(pick_active)
+        if pick_active:
             view.setCursor(QtCore.Qt.CursorShape.CrossCursor)
         else:
             view.unsetCursor()
         if self.popout_win and getattr(self.popout_win, 'view', None):
-            if self.pick_on_print and self.mode == 'Ballooning' and self.pdf_path:
+            self.popout_win.view.set_pick_mode(pick_active)
+            if pick_active:
                 self.popout_win.view.setCursor(QtCore.Qt.CursorShape.CrossCursor)
             else:
                 self.popout_win.view.unsetCursor()
@@ -1668,7 +2336,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 'pytesseract is not installed. Run "pip install pytesseract" in your environment.'
             )
             return
-        if Image is None:
+        try:
+            from PIL import Image  # type: ignore
+        except ImportError:
             QtWidgets.QMessageBox.warning(
                 self,
                 'OCR',
@@ -1676,20 +2346,25 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             return
         try:
-            page = self.doc.load_page(self.current_page)
+            with _FITZ_LOCK:
+                page = self.doc.load_page(self.current_page)
+                page_rect = page.rect
         except Exception as exc:
             QtWidgets.QMessageBox.warning(self, 'OCR', f'Unable to load the current page for OCR.\n{exc}')
             return
-        buffer = None
         image = None
         try:
-            matrix = fitz.Matrix(PAGE_RENDER_ZOOM * 2.0, PAGE_RENDER_ZOOM * 2.0)
-            pix = page.get_pixmap(matrix=matrix)
-            buffer = io.BytesIO(pix.tobytes('png'))
-            image = Image.open(buffer)
+            zoom = PAGE_RENDER_ZOOM * 2.0
+            # large-format sheets would otherwise produce bitmaps far past what Tesseract needs
+            page_area = float(page_rect.width) * float(page_rect.height)
+            if page_area > 0:
+                zoom = min(zoom, math.sqrt(OCR_MAX_PIXELS / page_area))
+            with _FITZ_LOCK:
+                pix = render_page_pixmap(page, zoom)
+                # hand the raw RGB samples to Pillow directly instead of a PNG encode/decode round trip
+                image = Image.frombytes('RGB', (pix.width, pix.height), pix.samples)
+                del pix
         except Exception as exc:
-            if buffer is not None:
-                buffer.close()
             QtWidgets.QMessageBox.warning(self, 'OCR', f'OCR capture failed.\n{exc}')
             return
         try:
@@ -1710,8 +2385,6 @@ class MainWindow(QtWidgets.QMainWindow):
                     image.close()
                 except Exception:
                     pass
-            if buffer is not None:
-                buffer.close()
         text = (text or '').strip()
         if not text:
             text = '(No text detected)'
@@ -1736,6 +2409,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not self.pdf_path:
             QtWidgets.QMessageBox.information(self, 'SPC', 'Open a PDF before viewing SPC data.')
             return
+        self._flush_pending_updates()
         try:
             dataset = spc.load_spc_dataset(self.pdf_path)
         except Exception as exc:
@@ -1748,14 +2422,16 @@ class MainWindow(QtWidgets.QMainWindow):
         dlg.exec()
 
     def _update_balloon_visibility(self):
-        for item in self.balloon_items:
-            item.setVisible(self.show_balloons)
+        if self._balloon_layer is not None:
+            self._balloon_layer.setVisible(self.show_balloons)
         self._apply_balloon_selection_visuals()
 
     def change_session(self):
         if not self.pdf_path:
             QtWidgets.QMessageBox.information(self, 'No PDF', 'Open a PDF first.')
             return
+        self._flush_pending_updates()
+        self._wo_cache.clear()
         if self._prompt_session(list_workorders(self.pdf_path)):
             self.refresh_table()
 
@@ -1783,9 +2459,8 @@ class MainWindow(QtWidgets.QMainWindow):
         is_ballooning = self.mode == 'Ballooning'
         self.pick_btn.setEnabled(has_pdf and is_ballooning)
         if not (has_pdf and is_ballooning):
-            self.pick_btn.blockSignals(True)
-            self.pick_btn.setChecked(False)
-            self.pick_btn.blockSignals(False)
+            with QtCore.QSignalBlocker(self.pick_btn):
+                self.pick_btn.setChecked(False)
             self.pick_on_print = False
             self.pick_btn.setText('Pick-on-Print')
         self._update_balloon_size_controls_enabled()
@@ -1813,11 +2488,71 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if not file_path:
             return
-        self._load_pdf(file_path)
+        self._open_pdf_async(file_path)
+
+    def _document_mtime(self, path: str) -> float | None:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
 
-    def _load_pdf(self, path: str):
+    def _open_pdf_async(self, path: str):
+        """Open a PDF on the worker pool so large files don't freeze the window; _pdf_opened finishes the load."""
+        mtime = self._document_mtime(path)
+        if bool(self.doc) and self.pdf_path == path and mtime is not None and mtime == self._doc_mtime:
+            # unchanged reopen keeps the parsed document, nothing slow left to offload
+            if self._opening_path is not None:
+                # supersede an open still running for another file, so its result is ignored when it arrives
+                self._opening_path = None
+                QtWidgets.QApplication.restoreOverrideCursor()
+                self.statusBar().clearMessage()
+            self._load_pdf(path)
+            return
+        # the worker reads the master rows, so queued edits for this file must be on disk first
+        self._flush_pending_updates()
+        if self._opening_path is None:
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.CursorShape.WaitCursor)
+        self._opening_path = path
+        self.statusBar().showMessage(f'Opening {Path(path).name}...')
+        try:
+            dpr = float(self.devicePixelRatioF())
+        except Exception:
+            dpr = 1.0
+        # same scale _render_current_page picks for a freshly shown page, so the first render is a cache hit
+        matrix_scale = float(PAGE_RENDER_ZOOM) * render_bucket(1.0) * dpr
+        QtCore.QThreadPool.globalInstance().start(PdfOpenTask(self._open_signals, path, matrix_scale))
+
+    def _pdf_opened(self, path: str, result: dict):
+        if path != self._opening_path:
+            # superseded by a later open request
+            if result.get('doc') is not None:
+                with _FITZ_LOCK:
+                    result['doc'].close()
+            return
+        self._opening_path = None
+        QtWidgets.QApplication.restoreOverrideCursor()
+        self.statusBar().clearMessage()
+        self._load_pdf(path, opened=result)
+
+    def _load_pdf(self, path: str, opened: dict | None = None):
+        if opened is not None:
+            mtime = opened.get('mtime')
+            reuse_doc = False
+        else:
+            mtime = self._document_mtime(path)
+            # reopening the same, unchanged file keeps the parsed document and its rendered pages
+            reuse_doc = bool(self.doc) and self.pdf_path == path and mtime is not None and mtime == self._doc_mtime
         try:
-            doc = fitz.open(path)
+            if opened is not None:
+                if opened.get('error') is not None:
+                    raise opened['error']
+                doc = opened['doc']
+            else:
+                if reuse_doc:
+                    doc = self.doc
+                else:
+                    with _FITZ_LOCK:
+                        doc = fitz.open(path, filetype='pdf')
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, 'Open PDF', f'Could not open PDF file.\n{exc}')
             # new PDF: default to ballooning without prompting
@@ -1826,20 +2561,45 @@ class MainWindow(QtWidgets.QMainWindow):
             self._update_mode_ui()
             return
 
+        page_rects = self._page_rects if reuse_doc else (opened or {}).get('page_rects')
+        if page_rects is None:
+            try:
+                page_rects = read_page_rects(doc)
+            except Exception as exc:
+                with _FITZ_LOCK:
+                    doc.close()
+                QtWidgets.QMessageBox.critical(self, 'Open PDF', f'Could not read PDF pages.\n{exc}')
+                return
+
         # clear any previous document before loading the new one
-        self._clear_loaded_pdf()
+        self._clear_loaded_pdf(keep_document=reuse_doc)
 
         self.doc = doc
+        self._doc_mtime = mtime
         self.pdf_path = path
-        self.total_pages = doc.page_count
+        self._page_rects = page_rects
+        self.total_pages = len(page_rects)
         self.current_page = 0
 
+        preloaded_rows = None
+        if opened is not None and opened.get('image') is not None:
+            try:
+                dpr = float(self.devicePixelRatioF())
+            except Exception:
+                dpr = 1.0
+            key = self._page_cache_key(0, opened['matrix_scale'])
+            self._store_page_pixmap(key, pixmap_from_image(opened['image'], dpr))
         try:
-            ensure_master(path)
+            if opened is not None:
+                if opened.get('master_error') is not None:
+                    raise opened['master_error']
+                preloaded_rows = opened.get('rows')
+            else:
+                ensure_master(path)
         except Exception as exc:
             QtWidgets.QMessageBox.warning(self, 'Master Data', f'Could not prepare master data for this PDF.\n{exc}')
 
-        self._load_rows()
+        self._load_rows(preloaded_rows)
         # Auto-select Ballooning when no existing data is present (empty master and no work orders)
         try:
             existing_orders = list_workorders(self.pdf_path)
@@ -1868,22 +2628,37 @@ class MainWindow(QtWidgets.QMainWindow):
             except Exception:
                 pass
 
-    def _clear_loaded_pdf(self):
+    def _clear_loaded_pdf(self, keep_document: bool = False):
+        self._flush_pending_updates()
+        self._wo_cache.clear()
         self._undo_stack.clear()
         self._undo_in_progress = False
         self._zoom_rerender_timer.stop()  # [ZOOM-DEBOUNCE]
         self._pending_zoom_scale = None  # [ZOOM-DEBOUNCE]
-        if self.doc:
-            try:
-                self.doc.close()
-            except Exception:
-                pass
+        self._awaited_render = None
+        if not keep_document:
+            self._page_cache.clear()
+            self._page_cache_bytes = 0
+            self._pending_page_renders.clear()
+            self._doc_generation += 1
+            self._page_rects = []
+            self._user_zoomed = False
+            self._prefetch_from_page = None
+            if self.doc:
+                try:
+                    with _FITZ_LOCK:
+                        self.doc.close()
+                except Exception:
+                    pass
+                shrink_fitz_store(100)
+            self._doc_mtime = None
         self.doc = None
         self.pdf_path = None
         self.current_page = 0
         self.total_pages = 0
         self.rows = []
-        self._clear_balloon_items()
+        self._reindex_rows()
+        self._discard_balloon_layer()
         self._suppress_auto_focus = False
         self.selected_feature_id = None
         self._clear_highlight_rect()
@@ -1897,7 +2672,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.popout_win.close()
             except Exception:
                 pass
-        self.table.setRowCount(0)
+        self._table_model.clear()
         self._update_mode_ui()
         self._update_page_controls_enabled()
         self._sync_page_spin()
@@ -1905,42 +2680,32 @@ class MainWindow(QtWidgets.QMainWindow):
         self._update_pdf_cursor()
         self._balloons_built_for_page = None  # [ZOOM-DEBOUNCE]
 
-    def _load_rows(self):
+    def _load_rows(self, rows: list[dict] | None = None):
         if not self.pdf_path:
             self.rows = []
+            self._reindex_rows()
             self._refresh_method_filter_options()
             return
-        rows = read_master(self.pdf_path)
-        prepared = []
-        for r in rows:
-            r = dict(r)
-            r['_pdf'] = self.pdf_path
-            r.setdefault('page', '1')
-            r.setdefault('x', '0')
-            r.setdefault('y', '0')
-            r.setdefault('w', '0')
-            r.setdefault('h', '0')
-            r.setdefault('bx', '0')
-            r.setdefault('by', '0')
-            r.setdefault('br', str(self.default_balloon_radius))
-            r.setdefault('zoom', '1.0')
-            prepared.append(r)
+        if rows is None:
+            rows = read_master(self.pdf_path)
+        defaults = dict(ROW_DEFAULTS, br=str(self.default_balloon_radius))
+        pdf_path = self.pdf_path
+        # one merge per row instead of a copy plus a setdefault per column
+        prepared = [{**defaults, **r, '_pdf': pdf_path} for r in rows]
         self.rows = prepared
+        self._reindex_rows()
         if prepared:
             try:
                 first_radius = float(prepared[0].get('br', self.default_balloon_radius))
             except Exception:
                 first_radius = self.default_balloon_radius
             self.default_balloon_radius = max(6, min(60, int(round(first_radius))))
-        # merge any methods from the master into the available options
+        # merge any methods from the master into the available options; the used set is reused by the refresh below
         existing = {m.strip() for m in self.method_options if m.strip()}
-        for feature in prepared:
-            method_value = (feature.get('method') or '').strip()
-            if method_value and method_value not in existing:
-                existing.add(method_value)
+        existing.update(self._used_method_set())
         self.method_options = sorted(existing, key=lambda s: s.lower())
         self._sync_balloon_size_spin(self.default_balloon_radius)
-        self._refresh_method_combobox_options()
+        self._queue_methods_refresh()
 
     def _maybe_rerender_for_zoom(self, view_scale: float):
         pdf_view = getattr(self, 'pdf_view', None)
@@ -1951,26 +2716,37 @@ class MainWindow(QtWidgets.QMainWindow):
         if pdf_view._last_render_scale is None:
             self._render_current_page(render_scale=view_scale)  # [CRISP-ZOOM]
             return
+        if render_bucket(view_scale) == render_bucket(pdf_view._last_render_scale):
+            return  # same raster either way; the view transform covers the difference
         lo = min(pdf_view._last_render_scale, view_scale)
         hi = max(pdf_view._last_render_scale, view_scale)
         if hi / max(lo, 1e-6) >= 1.6:  # [LOD-THRESHOLD]
             self._render_current_page(render_scale=view_scale)  # [CRISP-ZOOM]
 
     def _schedule_rerender_for_zoom(self, view_scale: float):
-        """Debounce heavy PDF re-rendering after zoom gestures."""  # [ZOOM-DEBOUNCE]
+        """Debounce heavy PDF re-rendering after zoom gestures, but never hold it back longer than the max wait."""  # [ZOOM-DEBOUNCE]
         if view_scale <= 0:
             return
         pdf_view = getattr(self, 'pdf_view', None)
         if not self.doc or not pdf_view or not pdf_view._pixmap_item:
             return
+        self._user_zoomed = True
+        if self._pending_zoom_scale is None:
+            self._zoom_burst_clock.start()
         self._pending_zoom_scale = view_scale
-        self._zoom_rerender_timer.start(100)
+        if self._zoom_burst_clock.elapsed() >= ZOOM_RERENDER_MAX_WAIT_MS:
+            # a continuous wheel or pinch gesture keeps restarting the debounce; render what we have now
+            self._zoom_rerender_timer.stop()
+            self._zoom_rerender_timeout()
+            return
+        self._zoom_rerender_timer.start(ZOOM_RERENDER_DELAY_MS)
 
     def _zoom_rerender_timeout(self):
         if self._pending_zoom_scale is None:
             return
         scale = self._pending_zoom_scale
         self._pending_zoom_scale = None
+        self._zoom_burst_clock.invalidate()
         if not self.doc or not getattr(self, 'pdf_view', None):
             return
         self._maybe_rerender_for_zoom(scale)
@@ -1978,15 +2754,11 @@ class MainWindow(QtWidgets.QMainWindow):
     def _render_current_page(self, render_scale: float | None = None):
         if not self.doc:
             return
-        page_count = self.doc.page_count
+        page_count = self.total_pages
         if page_count == 0:
             return
         self.current_page = max(0, min(self.current_page, page_count - 1))
-        try:
-            page = self.doc.load_page(self.current_page)
-        except Exception as exc:
-            QtWidgets.QMessageBox.warning(self, 'Render Failed', f'Unable to load page: {exc}')
-            return
+        page_rect = self._page_rects[self.current_page]
 
         if render_scale is None:
             self._zoom_rerender_timer.stop()  # [ZOOM-DEBOUNCE]
@@ -2003,22 +2775,41 @@ class MainWindow(QtWidgets.QMainWindow):
             dpr = 1.0
         base_scale = float(PAGE_RENDER_ZOOM)
         view_scale = float(render_scale or 1.0)
-        max_render_factor = 3.0  # [LOD-THRESHOLD]
-        effective_view_scale = min(view_scale, max_render_factor)  # [LOD-THRESHOLD]
-        matrix_scale = base_scale * effective_view_scale * dpr
-        pix = page.get_pixmap(matrix=fitz.Matrix(matrix_scale, matrix_scale))
-        qimage = QtGui.QImage.fromData(pix.tobytes('png'), 'PNG')
-        try:
-            qimage.setDevicePixelRatio(dpr)  # [CRISP-ZOOM]
-        except Exception:
-            pass
+        effective_view_scale = render_bucket(view_scale)  # [LOD-THRESHOLD]
+        requested_scale = base_scale * effective_view_scale * dpr
+        matrix_scale = limit_render_scale(page_rect, requested_scale)
+        cache_key = self._page_cache_key(self.current_page, matrix_scale)
+        pixmap = self._cached_page_pixmap(cache_key)
+        if pixmap is None:
+            # zooming back out: the next bucket up is still sharp enough and skips a re-render
+            pixmap = self._cached_sharper_page_pixmap(*cache_key)
+        if pixmap is None:
+            if render_scale is not None and pdf_view and pdf_view._pixmap_item:
+                # keep the current raster on screen and swap in the sharper one once the worker is done
+                self._awaited_render = (cache_key, render_scale)
+                self._queue_page_render(self.current_page, matrix_scale)
+                return
+            # only a cache miss touches the document, so a prefetched page never waits on the render worker
+            try:
+                with _FITZ_LOCK:
+                    page = self.doc.load_page(self.current_page)
+                try:
+                    image = render_page_image(page, matrix_scale)
+                finally:
+                    with _FITZ_LOCK:
+                        del page
+            except Exception as exc:
+                QtWidgets.QMessageBox.warning(self, 'Render Failed', f'Unable to render page: {exc}')
+                return
+            pixmap = pixmap_from_image(image, dpr)  # [CRISP-ZOOM]
+            self._store_page_pixmap(cache_key, pixmap)
+        self._awaited_render = None
 
-        page_rect = page.rect
         scene_width = float(page_rect.width) * float(PAGE_RENDER_ZOOM)
         scene_height = float(page_rect.height) * float(PAGE_RENDER_ZOOM)
 
         if pdf_view:
-            pdf_view.load_page(qimage, (scene_width, scene_height))
+            pdf_view.load_page(pixmap, (scene_width, scene_height))
             if preserve_center is not None:
                 pdf_view.centerOn(preserve_center)
             pdf_view._current_scale = pdf_view.transform().m11()
@@ -2030,19 +2821,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self._apply_balloon_selection_visuals()
 
         if self.selected_feature_id:
-            feature = next((r for r in self.rows if r.get('id') == self.selected_feature_id), None)
+            feature = self._rows_lookup(self.selected_feature_id)
             if feature:
-                try:
-                    x = float(feature.get('x', 0))
-                    y = float(feature.get('y', 0))
-                    w = float(feature.get('w', 0))
-                    h = float(feature.get('h', 0))
-                except Exception:
-                    feature = None
-                if feature:
+                rect = feature_rect(feature)
+                if rect is not None:
                     rect_item = self._ensure_highlight_rect()
                     if rect_item is not None:
-                        rect_item.setRect(QtCore.QRectF(x, y, w, h))
+                        rect_item.setRect(QtCore.QRectF(*rect))
                         rect_item.setVisible(True)
             else:
                 self._clear_highlight_rect()
@@ -2051,59 +2836,185 @@ class MainWindow(QtWidgets.QMainWindow):
 
         if render_scale is None:
             self._sync_page_spin()
+            # neighbours apply the pixel budget against their own page size
+            self._prefetch_neighbor_pages(requested_scale)
+            self._prefetch_zoom_buckets(base_scale * dpr, effective_view_scale)
+            # trim the store only after the queued renders ran, so they still find this page's fonts and images
+            self._store_shrink_pending = True
+            self._maybe_shrink_fitz_store()
+
+    def _page_cache_key(self, page_idx: int, matrix_scale: float) -> tuple[int, float]:
+        return page_idx, round(float(matrix_scale), 3)
+
+    def _cached_page_pixmap(self, key: tuple[int, float]) -> QtGui.QPixmap | None:
+        pixmap = self._page_cache.get(key)
+        if pixmap is not None:
+            self._page_cache.move_to_end(key)
+        return pixmap
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: QtGui.QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
+
+    def _cached_sharper_page_pixmap(self, page_idx: int, matrix_scale: float) -> QtGui.QPixmap | None:
+        best_key = None
+        for key in self._page_cache:
+            idx, scale = key
+            if idx == page_idx and matrix_scale < scale <= matrix_scale * 2.0 + 1e-6:
+                if best_key is None or scale < best_key[1]:
+                    best_key = key
+        if best_key is None:
+            return None
+        return self._cached_page_pixmap(best_key)
+
+    def _store_page_pixmap(self, key: tuple[int, float], pixmap: QtGui.QPixmap):
+        previous = self._page_cache.pop(key, None)
+        if previous is not None:
+            self._page_cache_bytes -= self._pixmap_bytes(previous)
+        self._page_cache[key] = pixmap
+        self._page_cache_bytes += self._pixmap_bytes(pixmap)
+        # always keep the newest entry, even if it alone exceeds the byte budget
+        while len(self._page_cache) > 1 and (
+            len(self._page_cache) > PAGE_CACHE_LIMIT or self._page_cache_bytes > PAGE_CACHE_BYTES
+        ):
+            _, evicted = self._page_cache.popitem(last=False)
+            self._page_cache_bytes -= self._pixmap_bytes(evicted)
 
-    def _rebuild_balloons(self):
-        self._clear_balloon_items()
-        if not self.pdf_view._pixmap_item:
+    def _queue_page_render(self, page_idx: int, matrix_scale: float):
+        if not self.doc or not self.pdf_path:
             return
-        for feature in self.rows:
-            page_str = feature.get('page', '1')
-            try:
-                page_idx = int(page_str) - 1
-            except ValueError:
-                page_idx = 0
-            if page_idx != self.current_page:
-                continue
-            feature['_pdf'] = self.pdf_path
-            item = BalloonItem(feature, self.pdf_view._pixmap_item)
-            try:
-                fid = feature.get('id')
-                if fid:
-                    item.setData(QtCore.Qt.ItemDataRole.UserRole, fid)
-            except Exception:
-                pass
-            self.pdf_view.scene().addItem(item)
-            self.balloon_items.append(item)
-        self._update_balloon_visibility()
+        if page_idx < 0 or page_idx >= self.total_pages:
+            return
+        matrix_scale = limit_render_scale(self._page_rects[page_idx], matrix_scale)
+        key = self._page_cache_key(page_idx, matrix_scale)
+        if key in self._page_cache or key in self._pending_page_renders:
+            return
+        self._pending_page_renders.add(key)
+        self._render_pool.start(
+            PageRenderTask(self._render_signals, self.pdf_path, self._doc_generation, page_idx, key[1])
+        )
+
+    def _prefetch_neighbor_pages(self, matrix_scale: float):
+        # the render pool is FIFO, so queue the pages in the direction the user is paging first
+        previous = self._prefetch_from_page
+        self._prefetch_from_page = self.current_page
+        step = -1 if previous is not None and previous > self.current_page else 1
+        for page_idx in (self.current_page + step, self.current_page - step, self.current_page + 2 * step):
+            self._queue_page_render(page_idx, matrix_scale)
+
+    def _prefetch_zoom_buckets(self, unit_scale: float, current_bucket: float):
+        # large renders for zoom levels nobody asked for would hold up neighbour prefetch and churn the cache
+        if not self._user_zoomed:
+            return
+        # only the next bucket up: zooming back out is served by _cached_sharper_page_pixmap
+        larger = [bucket for bucket in PREFETCH_ZOOM_BUCKETS if bucket > current_bucket]
+        if larger:
+            self._queue_page_render(self.current_page, unit_scale * min(larger))
+
+    def _maybe_shrink_fitz_store(self):
+        # PyMuPDF does not report the store size, so shrink once per page change when no render is queued
+        if self._store_shrink_pending and not self._pending_page_renders:
+            self._store_shrink_pending = False
+            shrink_fitz_store(FITZ_STORE_SHRINK_PERCENT)
+
+    def _page_rendered(self, doc_path: str, generation: int, page_idx: int, zoom: float, image: QtGui.QImage):
+        if generation != self._doc_generation or doc_path != self.pdf_path or not self.doc:
+            # rendered from a document that has since been closed or reloaded
+            return
+        key = self._page_cache_key(page_idx, zoom)
+        self._pending_page_renders.discard(key)
+        self._maybe_shrink_fitz_store()
+        try:
+            dpr = float(self.devicePixelRatioF())
+        except Exception:
+            dpr = 1.0
+        self._store_page_pixmap(key, pixmap_from_image(image, dpr))
+        awaited = self._awaited_render
+        if awaited is not None and awaited[0] == key and page_idx == self.current_page:
+            self._awaited_render = None
+            self._render_current_page(render_scale=awaited[1])
+
+    def _rebuild_balloons(self):
+        # hiding and rebinding a page's worth of items should reach the viewport as one repaint
+        self.pdf_view.setUpdatesEnabled(False)
+        try:
+            self._clear_balloon_items()
+            if not self.pdf_view._pixmap_item:
+                return
+            layer = self._balloon_layer
+            if layer is None:
+                # first build: fill a detached layer, then add it to the scene in one call
+                layer = BalloonLayer()
+                layer.setVisible(self.show_balloons)
+            for feature in self._rows_by_page.get(self.current_page, ()):
+                self._acquire_balloon_item(feature, layer)
+            if layer.scene() is None:
+                self.pdf_view.scene().addItem(layer)
+            self._balloon_layer = layer
+            self._update_balloon_visibility()
+        finally:
+            self.pdf_view.setUpdatesEnabled(True)
         self._balloons_built_for_page = self.current_page  # [ZOOM-DEBOUNCE]
 
+    def _acquire_balloon_item(self, feature: dict, layer: BalloonLayer) -> BalloonItem:
+        feature['_pdf'] = self.pdf_path
+        if self._balloon_pool:
+            item = self._balloon_pool.pop()
+            item.rebind(feature)
+            item.setVisible(True)
+        else:
+            item = BalloonItem(feature, self.pdf_view._pixmap_item, layer)
+        fid = feature.get('id')
+        if fid:
+            self._item_by_id[fid] = item
+        self.balloon_items.append(item)
+        return item
+
     def _clear_balloon_items(self):
+        # items are about to be rebound, so save any drag still waiting on the persist timer
+        self._persist_dirty_balloons()
         for item in self.balloon_items:
             try:
-                scene = item.scene()
-                if scene is not None:
-                    scene.removeItem(item)
-            except Exception:
-                pass
+                item.release()
+            except RuntimeError:
+                continue
+            self._balloon_pool.append(item)
         self.balloon_items = []
+        self._item_by_id = {}
+        self._selected_balloon_item = None
         self._apply_balloon_selection_visuals()
 
+    def _discard_balloon_layer(self):
+        self._clear_balloon_items()
+        layer = self._balloon_layer
+        self._balloon_layer = None
+        self._balloon_pool = []
+        if layer is not None:
+            try:
+                scene = layer.scene()
+                if scene is not None:
+                    scene.removeItem(layer)
+            except RuntimeError:
+                pass
+
     def _apply_balloon_selection_visuals(self):
+        # dimming is the layer's opacity; only the old and new selected balloons are touched
         selected_id = self.selected_feature_id if self.show_balloons else None
-        for item in self.balloon_items:
-            if not self.show_balloons:
-                item.setOpacity(1.0)
-                item.setZValue(10)
-                continue
-            if selected_id and item.feature.get('id') == selected_id:
-                item.setOpacity(1.0)
+        item = self._item_by_id.get(selected_id) if selected_id else None
+        previous = self._selected_balloon_item
+        if previous is not item:
+            if previous is not None:
+                try:
+                    previous.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIgnoresParentOpacity, False)
+                    previous.setZValue(10)
+                except RuntimeError:
+                    pass
+            if item is not None:
+                item.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIgnoresParentOpacity, True)
                 item.setZValue(20)
-            elif selected_id:
-                item.setOpacity(0.25)
-                item.setZValue(5)
-            else:
-                item.setOpacity(1.0)
-                item.setZValue(10)
+            self._selected_balloon_item = item
+        if self._balloon_layer is not None:
+            self._balloon_layer.setOpacity(0.25 if selected_id else 1.0)
 
     def _ensure_highlight_rect(self):
         rect_item = self.highlight_rect
@@ -2141,18 +3052,29 @@ class MainWindow(QtWidgets.QMainWindow):
     def _add_balloon_item(self, feature: dict):
         if not self.pdf_view._pixmap_item:
             return
-        feature['_pdf'] = self.pdf_path
-        item = BalloonItem(feature, self.pdf_view._pixmap_item)
+        if self._balloon_layer is None:
+            self._balloon_layer = BalloonLayer()
+            self._balloon_layer.setVisible(self.show_balloons)
+            self.pdf_view.scene().addItem(self._balloon_layer)
+        self._acquire_balloon_item(feature, self._balloon_layer)
+
+    def _remove_balloon_item(self, fid: str):
+        item = self._item_by_id.pop(fid, None)
+        if item is None:
+            return
         try:
-            fid = feature.get('id')
-            if fid:
-                item.setData(QtCore.Qt.ItemDataRole.UserRole, fid)
-        except Exception:
+            self.balloon_items.remove(item)
+        except ValueError:
             pass
-        self.pdf_view.scene().addItem(item)
-        self.balloon_items.append(item)
-        if not self.show_balloons:
-            item.hide()
+        if item is self._selected_balloon_item:
+            self._selected_balloon_item = None
+        # the feature is gone, so a pending drag save has nothing to write
+        self._dirty_balloons.discard(item)
+        try:
+            item.release()
+        except RuntimeError:
+            return
+        self._balloon_pool.append(item)
 
     def _rect_picked(self, rect: QtCore.QRect):
         if self.mode != 'Ballooning' or not self.pdf_path:
@@ -2189,13 +3111,13 @@ class MainWindow(QtWidgets.QMainWindow):
         new_feature['br'] = str(radius_value)
         self._suppress_auto_focus = True
         self.rows.append(new_feature)
+        self._rows_by_id[new_feature.get('id')] = new_feature
+        page_idx = feature_page_index(new_feature)
+        self._rows_by_page.setdefault(page_idx, []).append(new_feature)
+        self._methods_changed()
         self.selected_feature_id = new_feature.get('id')
-        self.refresh_table()
+        self._append_table_row(new_feature)
 
-        try:
-            page_idx = int(new_feature.get('page', '1')) - 1
-        except ValueError:
-            page_idx = 0
         if page_idx == self.current_page:
             self._add_balloon_item(new_feature)
             self._apply_balloon_selection_visuals()
@@ -2210,6 +3132,8 @@ class MainWindow(QtWidgets.QMainWindow):
         if not self.pdf_path:
             QtWidgets.QMessageBox.information(self, 'Export PDFs', 'Open a PDF before exporting.')
             return
+        # exports must see queued balloon drags and spec edits on disk
+        self._flush_pending_updates()
 
         default_dir = Path(self.pdf_path).parent if self.pdf_path else Path.home()
         default_base = Path(self.pdf_path).stem if self.pdf_path else 'axis'
@@ -2232,8 +3156,10 @@ class MainWindow(QtWidgets.QMainWindow):
 
         try:
             rows = self._collect_visible_rows()
-            self._export_inspection_pdf(inspection_path, rows)
-            self._export_ballooned_pdf(balloon_path)
+            # both exporters open, draw on and save fitz documents; keep background page renders out meanwhile
+            with _FITZ_LOCK:
+                self._export_inspection_pdf(inspection_path, rows)
+                self._export_ballooned_pdf(balloon_path)
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, 'Export PDFs', f'Unable to export PDFs.\n{exc}')
             return
@@ -2246,18 +3172,16 @@ class MainWindow(QtWidgets.QMainWindow):
         if not self.pdf_path:
             QtWidgets.QMessageBox.information(self, 'Export Results', 'Open a PDF before exporting results.')
             return
-        table = getattr(self, 'table', None)
-        if table is None or table.rowCount() == 0:
+        self._flush_pending_updates()
+        model = getattr(self, '_table_model', None)
+        if model is None or model.rowCount() == 0:
             QtWidgets.QMessageBox.information(self, 'Export Results', 'No rows available to export.')
             return
         rows = self._collect_visible_rows()
         if not rows:
             QtWidgets.QMessageBox.information(self, 'Export Results', 'The current filters produced no rows to export.')
             return
-        headers = []
-        for col in range(table.columnCount()):
-            header_item = table.horizontalHeaderItem(col)
-            headers.append(header_item.text() if header_item else f'Column {col + 1}')
+        headers = list(FeatureTableModel.HEADERS)
         base = Path(self.pdf_path).stem
         suffix_parts = ['results']
         if self.mode == 'Inspection' and self.current_wo:
@@ -2289,6 +3213,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not self.pdf_path:
             QtWidgets.QMessageBox.information(self, 'Export All Results', 'Open a PDF before exporting results.')
             return
+        self._flush_pending_updates()
         workorders = list_workorders(self.pdf_path)
         if not workorders:
             QtWidgets.QMessageBox.information(self, 'Export All Results', 'No inspection results were found for this PDF.')
@@ -2357,43 +3282,19 @@ class MainWindow(QtWidgets.QMainWindow):
         self.statusBar().showMessage(f'Exported all results to {selection}', 4000)
 
     def _collect_visible_rows(self):
-        rows = []
-        column_count = self.table.columnCount()
-        for row_idx in range(self.table.rowCount()):
-            row_values = []
-            for col_idx in range(column_count):
-                item = self.table.item(row_idx, col_idx)
-                if item is not None:
-                    row_values.append(item.text())
-                else:
-                    widget = self.table.cellWidget(row_idx, col_idx)
-                    if isinstance(widget, QtWidgets.QComboBox):
-                        row_values.append(widget.currentText())
-                    else:
-                        row_values.append('')
-            # Ensure status reflects the latest logic even if the table paint left it blank
-            if column_count > self.COL_STATUS:
-                status_text = (row_values[self.COL_STATUS] or '').strip().upper()
-                if status_text not in ('PASS', 'FAIL', '—'):
-                    result_text = (row_values[self.COL_RESULT] or '').strip()
-                    lsl_text = (row_values[self.COL_LSL] or '').strip()
-                    usl_text = (row_values[self.COL_USL] or '').strip()
-                    computed = '—'
-                    if result_text:
-                        upper = result_text.upper()
-                        if upper in ('PASS', 'FAIL'):
-                            computed = upper
-                        else:
-                            try:
-                                value = float(result_text)
-                                lsl_val = float(lsl_text) if lsl_text else None
-                                usl_val = float(usl_text) if usl_text else None
-                                if lsl_val is not None and usl_val is not None:
-                                    computed = 'PASS' if lsl_val <= value <= usl_val else 'FAIL'
-                            except Exception:
-                                computed = '—'
-                    row_values[self.COL_STATUS] = computed
-            rows.append(row_values)
+        """Visible table rows as display strings, with the status column settled to PASS/FAIL/— for the exporters."""
+        rows = self._table_model.row_values()
+        for row_values in rows:
+            # Ensure status reflects the latest logic even if a status was never computed for the row
+            status_text = (row_values[self.COL_STATUS] or '').strip().upper()
+            if status_text in ('PASS', 'FAIL', '—'):
+                row_values[self.COL_STATUS] = status_text
+            else:
+                row_values[self.COL_STATUS] = compute_status(
+                    (row_values[self.COL_RESULT] or '').strip(),
+                    (row_values[self.COL_LSL] or '').strip(),
+                    (row_values[self.COL_USL] or '').strip(),
+                )
         return rows
 
     def _derive_export_paths(self, selected: Path) -> tuple[Path, Path]:
@@ -2428,8 +3329,6 @@ class MainWindow(QtWidgets.QMainWindow):
         line_height = 16
         status_idx = self.COL_STATUS
         result_idx = self.COL_RESULT
-        lsl_idx = self.COL_LSL
-        usl_idx = self.COL_USL
         columns = [
             ('ID', 60, 0),
             ('Page', 40, 1),
@@ -2484,36 +3383,6 @@ class MainWindow(QtWidgets.QMainWindow):
             'FAIL': ((247 / 255, 205 / 255, 205 / 255), (0.55, 0, 0)),
         }
 
-        def compute_status_from_row(row_values: list[str]) -> str:
-            if not row_values:
-                return '—'
-            status_raw = row_values[status_idx] if len(row_values) > status_idx else ''
-            if status_raw:
-                upper = status_raw.strip().upper()
-                if upper in ('PASS', 'FAIL'):
-                    return upper
-            result_text = row_values[result_idx].strip() if len(row_values) > result_idx and row_values[result_idx] else ''
-            if not result_text:
-                return '—'
-            upper_res = result_text.upper()
-            if upper_res in ('PASS', 'FAIL'):
-                return upper_res
-            try:
-                value = float(result_text)
-            except Exception:
-                return '—'
-            try:
-                lsl_val = float(row_values[lsl_idx]) if len(row_values) > lsl_idx and row_values[lsl_idx] else None
-            except Exception:
-                lsl_val = None
-            try:
-                usl_val = float(row_values[usl_idx]) if len(row_values) > usl_idx and row_values[usl_idx] else None
-            except Exception:
-                usl_val = None
-            if lsl_val is not None and usl_val is not None:
-                return 'PASS' if lsl_val <= value <= usl_val else 'FAIL'
-            return '—'
-
         page, cursor_y = start_page(True)
 
         if not rows:
@@ -2524,7 +3393,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 row_len = len(row)
                 page, cursor_y = ensure_space(page, cursor_y)
                 x = margin
-                status_value = compute_status_from_row(row)
+                # _collect_visible_rows already settled every status to PASS/FAIL/—
+                status_value = row[status_idx] if row_len > status_idx else '—'
                 status_key = status_value
                 fill_color, text_color = status_colors.get(status_key, ((0.92, 0.92, 0.92), (0.2, 0.2, 0.2)))
                 for idx, (title, width, align) in enumerate(columns):
@@ -2550,7 +3420,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     x += width
                 cursor_y += line_height
 
-        doc.save(destination, garbage=4, deflate=True)
+        doc.save(destination, **EXPORT_SAVE_OPTIONS)
         doc.close()
 
     def _export_ballooned_pdf(self, destination: Path):
@@ -2558,39 +3428,41 @@ class MainWindow(QtWidgets.QMainWindow):
         scale = 1.0 / PAGE_RENDER_ZOOM
         circle_color = (220 / 255, 40 / 255, 40 / 255)
         fill_color = (1.0, 230 / 255, 230 / 255)
+        default_radius = self.default_balloon_radius
+        rows_by_page = self._rows_by_page
         try:
-            for page_index in range(doc.page_count):
+            # pages without balloons are copied as they are, without being loaded
+            for page_index in sorted(rows_by_page):
+                if not 0 <= page_index < doc.page_count:
+                    continue
                 page = doc.load_page(page_index)
-                for feature in self.rows:
-                    try:
-                        feature_page = int(feature.get('page', '1')) - 1
-                    except Exception:
-                        feature_page = 0
-                    if feature_page != page_index:
+                # one Shape per page: every balloon lands in a single content stream appended by one commit
+                shape = page.new_shape()
+                for feature in rows_by_page[page_index]:
+                    rect = feature_rect(feature)
+                    if rect is None:
                         continue
+                    x, y, w, h = rect
                     try:
-                        x = float(feature.get('x', 0)) * scale
-                        y = float(feature.get('y', 0)) * scale
-                        w = float(feature.get('w', 0)) * scale
-                        h = float(feature.get('h', 0)) * scale
-                        bx = float(feature.get('bx', 0)) * scale
-                        by = float(feature.get('by', 0)) * scale
-                        radius = float(feature.get('br', self.default_balloon_radius)) * scale
+                        bx = float(feature.get('bx', 0))
+                        by = float(feature.get('by', 0))
+                        radius = float(feature.get('br', default_radius)) * scale
                     except Exception:
                         continue
-                    center_x = x + (w / 2.0) + bx
-                    center_y = y + (h / 2.0) + by
-                    page.draw_circle((center_x, center_y), radius, color=circle_color, fill=fill_color, width=1.5)
-                    label = feature.get('id', '')
-                    match = re.search(r'(\d+)$', label)
-                    text = match.group(1) if match else label
+                    # center in scene units first, then one scale per axis into PDF points
+                    center_x = (x + (w / 2.0) + bx) * scale
+                    center_y = (y + (h / 2.0) + by) * scale
+                    shape.draw_circle((center_x, center_y), radius)
+                    shape.finish(color=circle_color, fill=fill_color, width=1.5)
+                    text = balloon_label(feature.get('id', ''))
                     font_size = max(8.0, radius * 1.15)
                     text_width = fitz.get_text_length(text, fontname='Times-Bold', fontsize=font_size)
                     ascent = font_size * 0.7
                     x_pos = center_x - (text_width / 2.0)
                     y_pos = center_y + (ascent / 2.0)
-                    page.insert_text((x_pos, y_pos), text, fontsize=font_size, fontname='Times-Bold', color=(0, 0, 0))
-            doc.save(destination, garbage=4, deflate=True)
+                    shape.insert_text((x_pos, y_pos), text, fontsize=font_size, fontname='Times-Bold', color=(0, 0, 0))
+                shape.commit()
+            doc.save(destination, **EXPORT_SAVE_OPTIONS)
         finally:
             doc.close()
 
@@ -2600,13 +3472,12 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         if self.mode != 'Ballooning' or not self.pdf_path:
             return
-        updated = False
+        radius_text = str(value)
+        # spinner ticks coalesce in the pending-update queue instead of rewriting the master each step
         for feature in self.rows:
-            if feature.get('br') != str(value):
-                feature['br'] = str(value)
-                updated = True
-        if updated:
-            self._persist_rows_to_master()
+            if feature.get('br') != radius_text:
+                feature['br'] = radius_text
+                self._queue_feature_update(feature.get('id'), {'br': radius_text})
         for item in self.balloon_items:
             item.set_radius(float(value))
 
@@ -2614,9 +3485,8 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.balloon_size_spin is None:
             return
         self._syncing_balloon_spin = True
-        self.balloon_size_spin.blockSignals(True)
-        self.balloon_size_spin.setValue(int(round(value)))
-        self.balloon_size_spin.blockSignals(False)
+        with QtCore.QSignalBlocker(self.balloon_size_spin):
+            self.balloon_size_spin.setValue(int(round(value)))
         self._syncing_balloon_spin = False
         try:
             self.default_balloon_radius = int(round(value))
@@ -2633,7 +3503,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def _page_spin_changed(self, value: int):
         if self._syncing_page_spin or not self.doc:
             return
-        target = max(0, min(value - 1, max(0, self.doc.page_count - 1)))
+        target = max(0, min(value - 1, max(0, self.total_pages - 1)))
         if target == self.current_page:
             return
         self._balloons_built_for_page = None  # [ZOOM-DEBOUNCE]
@@ -2648,11 +3518,9 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         self._syncing_page_spin = True
         try:
-            self.page_spin.blockSignals(True)
-            value = self.current_page + 1 if self.doc else 1
-            self.page_spin.setValue(value)
+            with QtCore.QSignalBlocker(self.page_spin):
+                self.page_spin.setValue(self.current_page + 1 if self.doc else 1)
         finally:
-            self.page_spin.blockSignals(False)
             self._syncing_page_spin = False
 
     def _update_page_controls_enabled(self):
@@ -2665,13 +3533,121 @@ class MainWindow(QtWidgets.QMainWindow):
         self.page_spin.setMinimum(1)
         self.page_spin.setMaximum(max_page)
 
-    def _persist_rows_to_master(self):
+    def _reindex_rows(self):
+        by_id: dict[str, dict] = {}
+        by_page: dict[int, list[dict]] = {}
+        for r in self.rows:
+            fid = r.get('id')
+            if fid:
+                by_id[fid] = r
+            by_page.setdefault(feature_page_index(r), []).append(r)
+        self._rows_by_id = by_id
+        self._rows_by_page = by_page
+        self._methods_changed()
+
+    def _methods_changed(self):
+        """Drop the method-derived caches after rows were added, removed or had their method edited."""
+        self._rows_by_method = None
+        self._method_counts = None
+        self._used_method_cache = None
+
+    def _method_edited(self, fid: str, method: str | None):
+        """Adjust the method counts for one row's method edit instead of rescanning every row."""
+        self._rows_by_method = None
+        counts = self._method_counts
+        if counts is None:
+            return
+        if fid not in self._counted_methods:
+            self._methods_changed()
+            return
+        previous = self._counted_methods[fid]
+        current = (method or '').strip()
+        if previous == current:
+            return
+        self._counted_methods[fid] = current
+        if previous in counts:
+            counts[previous] -= 1
+            if counts[previous] <= 0:
+                del counts[previous]
+                self._used_method_cache = None
+        if current:
+            if current not in counts:
+                self._used_method_cache = None
+            counts[current] = counts.get(current, 0) + 1
+
+    def _rows_with_method(self, method: str) -> list[dict]:
+        """Rows whose stripped, lowercased method equals method, so the method filter skips the other rows outright."""
+        by_method = self._rows_by_method
+        if by_method is None:
+            by_method = {}
+            for r in self.rows:
+                by_method.setdefault((r.get('method') or '').strip().lower(), []).append(r)
+            self._rows_by_method = by_method
+        return by_method.get(method, [])
+
+    def _rows_lookup(self, fid: str | None) -> dict | None:
+        """Feature dict for an id without scanning self.rows."""
+        return self._rows_by_id.get(fid) if fid else None
+
+    def _schedule_balloon_persist(self, item: BalloonItem):
+        self._dirty_balloons.add(item)
+        self._balloon_persist_timer.start()
+
+    def _persist_dirty_balloons(self):
+        self._balloon_persist_timer.stop()
+        items, self._dirty_balloons = self._dirty_balloons, set()
+        for item in items:
+            try:
+                item._persist_offset()
+            except RuntimeError:
+                pass
+
+    def _queue_feature_update(self, fid: str, updates: dict):
+        if not self.pdf_path or not fid or not updates:
+            return
+        self._pending_updates.setdefault(fid, {}).update(updates)
+        if not self._pending_updates_timer.isActive():
+            self._pending_updates_timer.start()
+
+    def _queue_result_update(self, fid: str, *, result: str | None = None, notes: str | None = None):
+        """Record a work order result/notes edit in the cache now and write it with the next flush."""
+        if not self.pdf_path or not self.current_wo or not fid:
+            return
+        entry = self._pending_results.setdefault(self.current_wo, {}).setdefault(fid, {})
+        if result is not None:
+            entry['result'] = result
+        if notes is not None:
+            entry['notes'] = notes
+        self._cache_workorder_entry(fid, result=result, notes=notes)
+        if not self._pending_updates_timer.isActive():
+            self._pending_updates_timer.start()
+
+    def _flush_pending_updates(self):
+        self._persist_dirty_balloons()
+        self._pending_updates_timer.stop()
+        if not self._pending_updates and not self._pending_results:
+            return
+        pending = self._pending_updates
+        pending_results = self._pending_results
+        self._pending_updates = {}
+        self._pending_results = {}
         if not self.pdf_path:
             return
-        payload = []
-        for row in self.rows:
-            payload.append({key: row.get(key, '') for key in MASTER_HEADER})
-        write_master(self.pdf_path, payload)
+        before = db_mtime(self.pdf_path)
+        try:
+            if pending:
+                batch_update_features(self.pdf_path, pending)
+        except Exception as exc:
+            self.statusBar().showMessage(f'Could not save feature changes: {exc}', 5000)
+        try:
+            for workorder, entries in pending_results.items():
+                batch_upsert_results(self.pdf_path, workorder, entries)
+        except Exception as exc:
+            self.statusBar().showMessage(f'Could not save inspection results: {exc}', 5000)
+        # our own write; keep a work order cache that was current before it from looking externally changed
+        cached = self._wo_cache.get((self.pdf_path, self.current_wo))
+        if cached is not None and cached[0] == before:
+            cached[0] = db_mtime(self.pdf_path)
 
     def _push_undo(self, handler, description: str):
         if not callable(handler):
@@ -2710,94 +3686,126 @@ class MainWindow(QtWidgets.QMainWindow):
         self._remove_feature(fid, persist=True)
         self.statusBar().showMessage(f'Removed {fid}', 3000)
 
-    def _undo_deleted_feature(self, snapshot: dict):
-        if not snapshot:
-            return
-        fid = snapshot.get('id')
-        self._restore_feature_snapshot(snapshot)
-        if fid:
-            self.statusBar().showMessage(f'Restored {fid}', 3000)
+    def _undo_deleted_features(self, snapshots: list[dict]):
+        restored = self._restore_feature_snapshots(snapshots)
+        if restored:
+            label = restored[0] if len(restored) == 1 else f'{len(restored)} balloons'
+            self.statusBar().showMessage(f'Restored {label}', 3000)
 
-    def _restore_feature_snapshot(self, snapshot: dict):
-        if not snapshot or not self.pdf_path:
-            return
-        snapshot_copy = dict(snapshot)
-        row_index = snapshot_copy.pop('_row_index', None)
-        fid = snapshot_copy.get('id')
-        if not fid:
-            return
-        master_row = {key: snapshot_copy.get(key, '') for key in MASTER_HEADER}
-        try:
-            rows = read_master(self.pdf_path)
-        except Exception:
-            rows = []
-        rows = [dict(r) for r in rows if r.get('id') != fid]
-        rows.append(master_row)
-
-        def sort_key(row):
-            label = row.get('id') or ''
-            match = re.search(r'(\d+)$', label)
-            return int(match.group(1)) if match else 0
-
-        rows.sort(key=sort_key)
-        write_master(self.pdf_path, rows)
-
-        snapshot_copy['_pdf'] = self.pdf_path
-        self.rows = [r for r in self.rows if r.get('id') != fid]
-        if row_index is None or row_index < 0 or row_index > len(self.rows):
-            self.rows.append(snapshot_copy)
-        else:
-            self.rows.insert(row_index, snapshot_copy)
+    def _restore_feature_snapshots(self, snapshots: list[dict]) -> list[str]:
+        """Put deleted features back at their '_row_index' positions with one write and one rebuild."""
+        if not snapshots or not self.pdf_path:
+            return []
+        restored = []
+        for snapshot in snapshots:
+            snapshot_copy = dict(snapshot)
+            row_index = snapshot_copy.pop('_row_index', None)
+            if snapshot_copy.get('id'):
+                snapshot_copy['_pdf'] = self.pdf_path
+                restored.append((row_index, snapshot_copy))
+        if not restored:
+            return []
+        self._flush_pending_updates()
+        # only these features change, so write their rows instead of reading and rewriting the whole master
+        upsert_features(self.pdf_path, [{key: row.get(key, '') for key in MASTER_HEADER} for _, row in restored])
+
+        fids = {row['id'] for _, row in restored}
+        self.rows = [r for r in self.rows if r.get('id') not in fids]
+        # ascending positions: each insert lands where it was before the rows after it were removed
+        restored.sort(key=lambda entry: (entry[0] is None, entry[0] or 0))
+        for row_index, row in restored:
+            if row_index is None or row_index < 0 or row_index > len(self.rows):
+                self.rows.append(row)
+            else:
+                self.rows.insert(row_index, row)
+        self._reindex_rows()
+        fid = restored[0][1]['id']
         self.selected_feature_id = fid
         self._suppress_auto_focus = True
         self.refresh_table()
         self._rebuild_balloons()
         self._apply_balloon_selection_visuals()
+        return [row['id'] for _, row in restored]
 
     def _remove_feature(self, fid: str, row_hint: int | None = None, persist: bool = True) -> dict | None:
-        if not fid:
-            return None
-        feature_snapshot = None
-        index = None
-        for idx, feature in enumerate(self.rows):
-            if feature.get('id') == fid:
-                feature_snapshot = dict(feature)
-                index = idx
-                break
-        if feature_snapshot is None:
-            return None
+        snapshots = self._remove_features([fid], row_hint=row_hint, persist=persist)
+        return snapshots[0] if snapshots else None
+
+    def _remove_features(self, fids, row_hint: int | None = None, persist: bool = True) -> list[dict]:
+        """Remove features in one pass; snapshots come back in ascending '_row_index' order for undo."""
+        doomed = {}
+        for fid in fids:
+            feature = self._rows_by_id.get(fid) if fid else None
+            if feature is not None:
+                doomed[fid] = feature
+        if not doomed:
+            return []
         if persist and self.pdf_path:
-            delete_feature(self.pdf_path, fid)
-        if self.selected_feature_id == fid:
+            if len(doomed) == 1:
+                delete_feature(self.pdf_path, next(iter(doomed)))
+            else:
+                delete_features(self.pdf_path, doomed)
+        if self.selected_feature_id in doomed:
             self.selected_feature_id = None
             self._clear_highlight_rect()
-        self.rows = [r for r in self.rows if r.get('id') != fid]
-        feature_snapshot['_row_index'] = index if index is not None else -1
-        self.refresh_table()
-        if row_hint is not None and self.table.rowCount() > 0:
-            target = max(0, min(row_hint, self.table.rowCount() - 1))
+        snapshots = []
+        kept = []
+        for index, row in enumerate(self.rows):
+            if row.get('id') in doomed and doomed[row.get('id')] is row:
+                snapshot = dict(row)
+                snapshot['_row_index'] = index
+                snapshots.append(snapshot)
+            else:
+                kept.append(row)
+        self.rows = kept
+        for fid, feature in doomed.items():
+            self._rows_by_id.pop(fid, None)
+            page_rows = self._rows_by_page.get(feature_page_index(feature))
+            if page_rows is not None:
+                page_rows[:] = [r for r in page_rows if r is not feature]
+        self._methods_changed()
+        model = self._table_model
+        self._syncing_table_selection = True
+        try:
+            model.remove_rows(model.row_of(fid) for fid in doomed)
+        finally:
+            self._syncing_table_selection = False
+        self._sync_table_selection()
+        if row_hint is not None and model.rowCount() > 0:
+            target = max(0, min(row_hint, model.rowCount() - 1))
             self.table.selectRow(target)
-        self._rebuild_balloons()
+        for fid in doomed:
+            self._remove_balloon_item(fid)
         self._apply_balloon_selection_visuals()
-        return feature_snapshot
+        return snapshots
 
 
 class SPCChartWidget(QtWidgets.QWidget):
+    # shared painting resources, so paintEvent allocates nothing per sample
+    BACKGROUND = QtGui.QColor(23, 23, 23)
+    TEXT_COLOR = QtGui.QColor(200, 200, 200)
+    FRAME_PEN = QtGui.QPen(QtGui.QColor(120, 120, 120), 1)
+    LSL_PEN = QtGui.QPen(QtGui.QColor(255, 140, 140), 1, QtCore.Qt.PenStyle.DashLine)
+    USL_PEN = QtGui.QPen(QtGui.QColor(140, 200, 255), 1, QtCore.Qt.PenStyle.DashLine)
+    POINT_PEN = QtGui.QPen(QtGui.QColor(200, 200, 90), 2)
+    POINT_BRUSH = QtGui.QBrush(QtGui.QColor(200, 200, 90))
+    TREND_PEN = QtGui.QPen(QtGui.QColor(160, 220, 255), 2)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._feature_data: spc.FeatureSPCData | None = None
         self.setMinimumSize(320, 220)
 
-    def set_feature_data(self, data: spc.FeatureSPCData | None):
+    def set_feature_data(self, data: "spc.FeatureSPCData | None"):
         self._feature_data = data
         self.update()
 
     def paintEvent(self, event):
         painter = QtGui.QPainter(self)
-        painter.fillRect(self.rect(), QtGui.QColor(23, 23, 23))
+        painter.fillRect(self.rect(), self.BACKGROUND)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
         if not self._feature_data or not self._feature_data.measurements:
-            painter.setPen(QtGui.QColor(200, 200, 200))
+            painter.setPen(self.TEXT_COLOR)
             painter.drawText(self.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, 'No data')
             return
         rect = QtCore.QRectF(self.rect().adjusted(24, 16, -16, -32))
@@ -2814,12 +3822,14 @@ class SPCChartWidget(QtWidgets.QWidget):
         margin = span * 0.1 if span > 1e-6 else 1.0
         min_val -= margin
         max_val += margin
-        painter.setPen(QtGui.QPen(QtGui.QColor(120, 120, 120), 1))
+        painter.setPen(self.FRAME_PEN)
         painter.drawRect(rect)
-        self._draw_spec_line(painter, rect, min_val, max_val, self._feature_data.lsl, QtGui.QColor(255, 140, 140))
-        self._draw_spec_line(painter, rect, min_val, max_val, self._feature_data.usl, QtGui.QColor(140, 200, 255))
+        self._draw_spec_line(painter, rect, min_val, max_val, self._feature_data.lsl, self.LSL_PEN)
+        self._draw_spec_line(painter, rect, min_val, max_val, self._feature_data.usl, self.USL_PEN)
         path = QtGui.QPainterPath()
         count = len(values)
+        painter.setBrush(self.POINT_BRUSH)
+        painter.setPen(self.POINT_PEN)
         for idx, value in enumerate(values):
             x_ratio = idx / (count - 1) if count > 1 else 0.0
             x = rect.left() + x_ratio * rect.width()
@@ -2828,12 +3838,10 @@ class SPCChartWidget(QtWidgets.QWidget):
                 path.moveTo(x, y)
             else:
                 path.lineTo(x, y)
-            painter.setBrush(QtGui.QBrush(QtGui.QColor(200, 200, 90)))
-            painter.setPen(QtGui.QPen(QtGui.QColor(200, 200, 90), 2))
             painter.drawEllipse(QtCore.QPointF(x, y), 3, 3)
-        painter.setPen(QtGui.QPen(QtGui.QColor(160, 220, 255), 2))
+        painter.setPen(self.TREND_PEN)
         painter.drawPath(path)
-        painter.setPen(QtGui.QColor(200, 200, 200))
+        painter.setPen(self.TEXT_COLOR)
         painter.drawText(QtCore.QPointF(rect.right() - 90, rect.bottom() + 20), 'Sample #')
 
     def _value_to_y(self, rect: QtCore.QRectF, min_val: float, max_val: float, value: float) -> float:
@@ -2842,16 +3850,16 @@ class SPCChartWidget(QtWidgets.QWidget):
         ratio = (value - min_val) / (max_val - min_val)
         return rect.bottom() - ratio * rect.height()
 
-    def _draw_spec_line(self, painter: QtGui.QPainter, rect: QtCore.QRectF, min_val: float, max_val: float, value: float | None, color: QtGui.QColor):
+    def _draw_spec_line(self, painter: QtGui.QPainter, rect: QtCore.QRectF, min_val: float, max_val: float, value: float | None, pen: QtGui.QPen):
         if value is None:
             return
         y = self._value_to_y(rect, min_val, max_val, value)
-        painter.setPen(QtGui.QPen(color, 1, QtCore.Qt.PenStyle.DashLine))
+        painter.setPen(pen)
         painter.drawLine(QtCore.QLineF(rect.left(), y, rect.right(), y))
 
 
 class SPCDialog(QtWidgets.QDialog):
-    def __init__(self, parent: QtWidgets.QWidget | None, pdf_path: str, dataset: dict[str, spc.FeatureSPCData]):
+    def __init__(self, parent: QtWidgets.QWidget | None, pdf_path: str, dataset: "dict[str, spc.FeatureSPCData]"):
         super().__init__(parent)
         self.pdf_path = pdf_path
         self.dataset = dataset
@@ -2922,7 +3930,7 @@ class SPCDialog(QtWidgets.QDialog):
         )
         self._populate_measurement_table(measurements)
 
-    def _update_stats(self, data: spc.FeatureSPCData | None):
+    def _update_stats(self, data: "spc.FeatureSPCData | None"):
         if not data:
             for lbl in self.stats_labels.values():
                 lbl.setText('—')
@@ -2936,23 +3944,46 @@ class SPCDialog(QtWidgets.QDialog):
         self.stats_labels['cp'].setText(spc.format_stat(stats.cp))
         self.stats_labels['cpk'].setText(spc.format_stat(stats.cpk))
 
-    def _populate_measurement_table(self, measurements: list[spc.Measurement]):
-        self.measurement_table.setRowCount(len(measurements))
-        for row, measurement in enumerate(measurements):
-            ts_text = measurement.timestamp.strftime('%Y-%m-%d %H:%M') if measurement.timestamp else '—'
-            row_values = (
-                measurement.workorder,
-                f'{measurement.value:.4f}',
-                ts_text,
-                measurement.source_path,
-            )
-            for col, text in enumerate(row_values):
-                item = QtWidgets.QTableWidgetItem(text)
-                item.setFlags(item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
-                self.measurement_table.setItem(row, col, item)
+    def _populate_measurement_table(self, measurements: "list[spc.Measurement]"):
+        table = self.measurement_table
+        header = table.horizontalHeader()
+        # fill with fixed columns and repaints off, then size the content columns once instead of per setItem
+        resize_modes = [header.sectionResizeMode(col) for col in range(table.columnCount())]
+        was_sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        try:
+            table.setRowCount(len(measurements))
+            for row, measurement in enumerate(measurements):
+                ts_text = measurement.timestamp.strftime('%Y-%m-%d %H:%M') if measurement.timestamp else '—'
+                row_values = (
+                    measurement.workorder,
+                    f'{measurement.value:.4f}',
+                    ts_text,
+                    measurement.source_path,
+                )
+                for col, text in enumerate(row_values):
+                    item = QtWidgets.QTableWidgetItem(text)
+                    item.setFlags(item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
+                    table.setItem(row, col, item)
+        finally:
+            for col, mode in enumerate(resize_modes):
+                header.setSectionResizeMode(col, mode)
+            table.setSortingEnabled(was_sorting)
+            table.setUpdatesEnabled(True)
 
 
 def main():
+    global USE_OPENGL_VIEWPORT
+    if '--opengl' in sys.argv[1:]:
+        sys.argv.remove('--opengl')
+        USE_OPENGL_VIEWPORT = QOpenGLWidget is not None
+        if USE_OPENGL_VIEWPORT:
+            # multisampling must be requested before the application creates any GL surface
+            surface_format = QtGui.QSurfaceFormat()
+            surface_format.setSamples(4)
+            QtGui.QSurfaceFormat.setDefaultFormat(surface_format)
     app = QtWidgets.QApplication(sys.argv)
     win = MainWindow()
     win.resize(1200, 800)
@@ -5,16 +5,31 @@ import re
 import sqlite3
 from contextlib import closing
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 
 MASTER_HEADER = ["id", "page", "x", "y", "w", "h", "zoom", "method", "nominal", "lsl", "usl", "bx", "by", "br", "username"]
 DB_SUFFIX = ".axis.db"
+# databases already initialized/migrated by this process; _connect skips ensure_master for these
+_READY_DBS: set = set()
+_TRAILING_DIGITS_RE = re.compile(r"(\d+)$")
+_NUMBER = r"[+-]?\d*\.?\d+"
+_BILATERAL_RE = re.compile(rf"({_NUMBER})\s*(?:±|\+/-|/\-\+|\+\-|\+/?-?)\s*({_NUMBER})")
+_UNILATERAL_RE = re.compile(rf"({_NUMBER})\s*([+-]\s*\d*\.?\d+)(?:\s*/\s*)?\s*([+-]\s*\d*\.?\d+)")
+_PLAIN_NUMBER_RE = re.compile(rf"({_NUMBER})")
 
 
 def _db_path(pdf_path: str) -> str:
     return f"{pdf_path}{DB_SUFFIX}"
 
 
+def db_mtime(pdf_path: str) -> Optional[float]:
+    """Modification time of the PDF's database, or None when it does not exist."""
+    try:
+        return os.path.getmtime(_db_path(pdf_path))
+    except OSError:
+        return None
+
+
 def ensure_master(pdf_path: str) -> str:
     """Ensure the SQLite database exists and is initialized; migrate legacy CSV data when present."""
     db_path = _db_path(pdf_path)
@@ -30,6 +45,7 @@ def ensure_master(pdf_path: str) -> str:
         _maybe_migrate_from_csv(pdf_path, conn)
     finally:
         conn.close()
+    _READY_DBS.add(db_path)
     return db_path
 
 
@@ -73,8 +89,10 @@ def _initialize_db(conn: sqlite3.Connection):
 
 
 def _connect(pdf_path: str) -> sqlite3.Connection:
-    ensure_master(pdf_path)
-    conn = sqlite3.connect(_db_path(pdf_path))
+    db_path = _db_path(pdf_path)
+    if db_path not in _READY_DBS or not os.path.exists(db_path):
+        ensure_master(pdf_path)
+    conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
     return conn
@@ -156,13 +174,17 @@ def _maybe_migrate_from_csv(pdf_path: str, conn: sqlite3.Connection):
 
 
 def read_master(pdf_path: str) -> List[Dict[str, str]]:
+    columns = ", ".join(f"COALESCE({key}, '')" for key in MASTER_HEADER)
     with closing(_connect(pdf_path)) as conn:
-        cur = conn.execute(f"SELECT {', '.join(MASTER_HEADER)} FROM features ORDER BY id COLLATE NOCASE")
-        rows = []
-        for row in cur.fetchall():
-            data = {key: (row[key] if row[key] is not None else "") for key in MASTER_HEADER}
-            rows.append(data)
-        return rows
+        # plain tuples: sqlite3.Row lookups by name dominate the cost on large feature tables
+        conn.row_factory = None
+        cur = conn.execute(f"SELECT {columns} FROM features ORDER BY id COLLATE NOCASE")
+        return [dict(zip(MASTER_HEADER, row)) for row in cur]
+
+
+def _column_text(value) -> str:
+    """Column value as stored text; in-memory rows may hold floats (e.g. a 0.0 balloon offset mid-drag)."""
+    return "" if value is None else str(value)
 
 
 def write_master(pdf_path: str, rows: List[Dict[str, str]]):
@@ -175,7 +197,7 @@ def write_master(pdf_path: str, rows: List[Dict[str, str]]):
             if not fid:
                 continue
             incoming_ids.add(fid)
-            payload = {key: (row.get(key, "") or "") for key in MASTER_HEADER}
+            payload = {key: _column_text(row.get(key)) for key in MASTER_HEADER}
             placeholders = ", ".join("?" for _ in MASTER_HEADER)
             columns = ", ".join(MASTER_HEADER)
             if fid in existing_ids:
@@ -194,7 +216,7 @@ def _next_feature_id(conn: sqlite3.Connection) -> str:
     maxn = 0
     for row in conn.execute("SELECT id FROM features"):
         vid = row[0] or ""
-        m = re.search(r"(\d+)$", vid)
+        m = _TRAILING_DIGITS_RE.search(vid)
         if m:
             maxn = max(maxn, int(m.group(1)))
     return f"{maxn + 1:03d}"
@@ -236,6 +258,50 @@ def update_feature(pdf_path: str, fid: str, updates: Dict[str, str]):
         conn.commit()
 
 
+def upsert_features(pdf_path: str, features: Iterable[Dict[str, str]]) -> int:
+    """Insert or fully replace several feature rows in one transaction; returns how many were written."""
+    payload = [
+        [_column_text(feature.get(col)) for col in MASTER_HEADER]
+        for feature in features
+        if feature.get("id")
+    ]
+    if not payload:
+        return 0
+    columns = ", ".join(MASTER_HEADER)
+    placeholders = ", ".join("?" for _ in MASTER_HEADER)
+    assignments = ", ".join(f"{col} = excluded.{col}" for col in MASTER_HEADER if col != "id")
+    with closing(_connect(pdf_path)) as conn:
+        conn.executemany(
+            f"INSERT INTO features ({columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT(id) DO UPDATE SET {assignments}",
+            payload,
+        )
+        conn.commit()
+    return len(payload)
+
+
+def batch_update_features(pdf_path: str, updates: Dict[str, Dict[str, str]]):
+    """Apply {fid: {column: value}} updates in a single connection and transaction."""
+    if not updates:
+        return
+    with closing(_connect(pdf_path)) as conn:
+        for fid, changes in updates.items():
+            if not fid or not changes:
+                continue
+            assignments = []
+            values = []
+            for key, value in changes.items():
+                if key not in MASTER_HEADER or key == "id":
+                    continue
+                assignments.append(f"{key} = ?")
+                values.append(value)
+            if not assignments:
+                continue
+            values.append(fid)
+            conn.execute(f"UPDATE features SET {', '.join(assignments)} WHERE id = ?", values)
+        conn.commit()
+
+
 def delete_feature(pdf_path: str, fid: str) -> bool:
     if not fid:
         return False
@@ -245,6 +311,18 @@ def delete_feature(pdf_path: str, fid: str) -> bool:
         return cur.rowcount > 0
 
 
+def delete_features(pdf_path: str, fids: Iterable[str]) -> int:
+    """Delete several features in one transaction; returns how many rows were removed."""
+    ids = [(fid,) for fid in dict.fromkeys(fids) if fid]
+    if not ids:
+        return 0
+    with closing(_connect(pdf_path)) as conn:
+        before = conn.total_changes
+        conn.executemany("DELETE FROM features WHERE id = ?", ids)
+        conn.commit()
+        return conn.total_changes - before
+
+
 def current_username() -> str:
     try:
         return getpass.getuser()
@@ -303,35 +381,39 @@ def write_wo(pdf_path: str, workorder: str, data: Dict[str, str], notes: Optiona
 
 
 def upsert_result_entry(pdf_path: str, workorder: str, feature_id: str, *, result: Optional[str] = None, notes: Optional[str] = None):
-    if not workorder or not feature_id:
+    entry = {}
+    if result is not None:
+        entry["result"] = result
+    if notes is not None:
+        entry["notes"] = notes
+    batch_upsert_results(pdf_path, workorder, {feature_id: entry})
+
+
+def batch_upsert_results(pdf_path: str, workorder: str, entries: Dict[str, Dict[str, str]]):
+    """Apply {fid: {'result'/'notes': value}} to one work order in a single connection and transaction."""
+    if not workorder or not entries:
         return
     timestamp = datetime.utcnow().isoformat()
     with closing(_connect(pdf_path)) as conn:
-        row = conn.execute(
-            "SELECT 1 FROM results WHERE feature_id = ? AND workorder = ?",
-            (feature_id, workorder)
-        ).fetchone()
-        if row:
+        for feature_id, entry in entries.items():
+            if not feature_id:
+                continue
+            result = entry.get("result")
+            notes = entry.get("notes")
+            # new rows get '' for the column not supplied; existing rows only change the supplied columns
             assignments = []
-            values: list[str] = []
             if result is not None:
-                assignments.append("result = ?")
-                values.append(result)
+                assignments.append("result = excluded.result")
             if notes is not None:
-                assignments.append("notes = ?")
-                values.append(notes)
-            if not assignments:
-                return
-            assignments.append("updated_at = ?")
-            values.append(timestamp)
-            values.extend([feature_id, workorder])
-            conn.execute(
-                f"UPDATE results SET {', '.join(assignments)} WHERE feature_id = ? AND workorder = ?",
-                values
-            )
-        else:
+                assignments.append("notes = excluded.notes")
+            if assignments:
+                assignments.append("updated_at = excluded.updated_at")
+                conflict = f"DO UPDATE SET {', '.join(assignments)}"
+            else:
+                conflict = "DO NOTHING"
             conn.execute(
-                "INSERT INTO results (feature_id, workorder, result, notes, updated_at) VALUES (?, ?, ?, ?, ?)",
+                "INSERT INTO results (feature_id, workorder, result, notes, updated_at) VALUES (?, ?, ?, ?, ?) "
+                f"ON CONFLICT(feature_id, workorder) {conflict}",
                 (feature_id, workorder, result or '', notes or '', timestamp)
             )
         conn.commit()
@@ -378,14 +460,14 @@ def parse_tolerance_expression(s: str) -> Tuple[float, float, float]:
         raise ValueError("empty")
 
     # equal bilateral: look for ± or +/- or \u00B1
-    m = re.fullmatch(r"([+-]?\d*\.?\d+)\s*(?:±|\+/-|/\-\+|\+\-|\+/?-?)\s*([+-]?\d*\.?\d+)", s2)
+    m = _BILATERAL_RE.fullmatch(s2)
     if m:
         nom = float(m.group(1))
         tol = abs(float(m.group(2)))
         return nom, nom - tol, nom + tol
 
     # alternative: explicit +/- with spaces: nominal +a -b  (order may vary)
-    m = re.fullmatch(r"([+-]?\d*\.?\d+)\s*([+-]\s*\d*\.?\d+)(?:\s*/\s*)?\s*([+-]\s*\d*\.?\d+)", s2)
+    m = _UNILATERAL_RE.fullmatch(s2)
     if m:
         nom = float(m.group(1))
         a = float(m.group(2).replace(" ", ""))
@@ -405,7 +487,7 @@ def parse_tolerance_expression(s: str) -> Tuple[float, float, float]:
         return nom, nom - minus, nom + plus
 
     # plain number
-    m = re.fullmatch(r"([+-]?\d*\.?\d+)", s2)
+    m = _PLAIN_NUMBER_RE.fullmatch(s2)
     if m:
         nom = float(m.group(1))
         # decimals